@@ -1,3 +1,35 @@
 """Hydrograph and Seatek Sensor Data Analysis Package."""
 
+from importlib import import_module
+from typing import Any, List
+
 __version__ = "1.0.0"
+
+# Public classes are resolved lazily (PEP 562) so that importing the package,
+# e.g. for ``__version__``, does not pull in pandas or matplotlib.
+_LAZY_ATTRIBUTES = {
+    "Application": ".app",
+    "ChartGenerator": ".visualization.chart_generator",
+    "Config": ".core.config",
+    "DataLoader": ".data.data_loader",
+    "DataValidator": ".data.validator",
+    "SeatekDataProcessor": ".data.processor",
+}
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes from their submodules on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
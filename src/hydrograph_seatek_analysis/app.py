@@ -10,12 +10,14 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+import matplotlib
+
 from .core.config import Config
 from .core.logger import configure_root_logger
 from .data.data_loader import DataLoader
 from .data.processor import SeatekDataProcessor
 from .utils.security import is_safe_path, sanitize_filename
-from .visualization.chart_generator import ChartGenerator
+from .visualization.chart_generator import ChartGenerator, sensor_number
 
 
 class Application:
@@ -48,22 +50,14 @@ class Application:
         try:
             self.logger.info("⚙️  Setting up application environment")
 
-            # Verify directories exist
-            required_dirs = [
-                self.config.data_dir,
-                self.config.raw_data_dir,
-                self.config.processed_dir,
-                self.config.output_dir,
-            ]
-
-            for directory in required_dirs:
-                directory.mkdir(parents=True, exist_ok=True)
-                self.logger.debug(f"Verified directory: {directory}")
+            # Create the data and output directories on first real use
+            self.config.ensure_directories()
+            self.logger.debug("Verified directories under: %s", self.config.base_dir)
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Error setting up application: {e}")
+            self.logger.error("Error setting up application: %s", e)
             return False
 
     def load_data(self) -> bool:
@@ -90,12 +84,13 @@ class Application:
             self.processor.load_data()
 
             self.logger.info(
-                f"✅ Loaded data for {len(self.processor.river_mile_data):,} river miles"
+                "✅ Loaded data for %s river miles",
+                format(len(self.processor.river_mile_data), ","),
             )
             return True
 
         except Exception as e:
-            self.logger.error(f"❌ Error loading data: {e}")
+            self.logger.error("❌ Error loading data: %s", e)
             return False
 
     @staticmethod
@@ -103,7 +98,7 @@ class Application:
         river_mile: float, year: int, sensor: str
     ) -> dict[str, str]:
         """Create metadata for chart accessibility."""
-        sensor_num = sensor.split("_")[1] if "_" in sensor else sensor
+        sensor_num = sensor_number(sensor)
         return {
             "Title": (
                 f"River Mile {river_mile:.1f} - Year {year} " f"Sensor {sensor_num}"
@@ -117,24 +112,34 @@ class Application:
             "Author": "Hydrograph vs Seatek Sensors Analysis Project",
         }
 
-    def _save_generated_chart(
-        self, chart: Any, rm_data: Any, year: int, sensor: str
-    ) -> bool:
-        """Helper to safely save a generated chart."""
+    def _chart_output_path(self, rm_data: Any, year: int, sensor: str) -> Path:
+        """Return the sanitized output path of one river mile, year and sensor chart."""
         safe_year = sanitize_filename(str(year))
         safe_sensor = sanitize_filename(str(sensor))
         safe_rm = sanitize_filename(f"{rm_data.river_mile:.1f}")
 
-        output_path = (
+        return (
             self.config.output_dir
             / f"RM_{safe_rm}"
             / f"Year_{safe_year}_{safe_sensor}.png"
         )
 
+    def _save_generated_chart(
+        self,
+        chart: Any,
+        rm_data: Any,
+        year: int,
+        sensor: str,
+        digest: Optional[str] = None,
+    ) -> bool:
+        """Helper to safely save a generated chart."""
+        output_path = self._chart_output_path(rm_data, year, sensor)
+
         # SECURITY: Verify that the generated path remains within the output directory
         if not is_safe_path(self.config.output_dir, output_path):
             self.logger.error(
-                f"SECURITY: Attempted path traversal detected. Path outside output directory: {output_path}"
+                "SECURITY: Attempted path traversal detected. Path outside output directory: %s",
+                output_path,
             )
             return False
 
@@ -142,7 +147,47 @@ class Application:
         metadata = self._create_chart_metadata(rm_data.river_mile, year, sensor)
 
         return self.chart_generator.save_chart(
-            chart, str(output_path), metadata=metadata
+            chart, str(output_path), metadata=metadata, digest=digest
+        )
+
+    def _save_chart_grid(
+        self, entries: list[tuple[int, str, Any]], rm_data: Any
+    ) -> bool:
+        """Helper to create and safely save one river mile's chart grid."""
+        fig = self.chart_generator.create_chart_grid(entries, rm_data.river_mile)
+        if fig is None:
+            self.logger.error(
+                "❌ Failed to create chart grid for RM %s", rm_data.river_mile
+            )
+            return False
+
+        safe_rm = sanitize_filename(f"{rm_data.river_mile:.1f}")
+        output_path = (
+            self.config.output_dir / f"RM_{safe_rm}" / f"RM_{safe_rm}_grid.png"
+        )
+
+        # SECURITY: Verify that the generated path remains within the output directory
+        if not is_safe_path(self.config.output_dir, output_path):
+            self.logger.error(
+                "SECURITY: Attempted path traversal detected. Path outside output directory: %s",
+                output_path,
+            )
+            return False
+
+        metadata = {
+            "Title": f"River Mile {rm_data.river_mile:.1f} - All Years and Sensors",
+            "Description": (
+                "Grid of charts showing Seatek sensor data (NAVD88) and "
+                "Hydrograph flow (GPM) over time for each year and sensor of "
+                f"River Mile {rm_data.river_mile:.1f}."
+            ),
+            "Author": "Hydrograph vs Seatek Sensors Analysis Project",
+        }
+        return self.chart_generator.save_chart(
+            fig,
+            str(output_path),
+            dpi=self.chart_generator.grid_dpi(fig),
+            metadata=metadata,
         )
 
     def process_data(self) -> bool:
@@ -163,9 +208,14 @@ class Application:
             self.logger.info("📊 Processing data and generating visualizations")
             success_count = 0
             error_count = 0
+            unchanged_count = 0
+
+            grid = self.config.chart_settings.grid_per_river_mile
+            skip_unchanged = self.config.chart_settings.skip_unchanged
 
             # Process each river mile, year, and sensor
             for rm_data in self.processor.river_mile_data.values():
+                grid_entries: list[tuple[int, str, Any]] = []
                 # Optimization: Extract unique years from the pre-grouped dictionary cache
                 # and sort them once per river mile rather than repeatedly calling
                 # sorted() inside the sensor loop.
@@ -180,11 +230,32 @@ class Application:
 
                             if len(processed_data) == 0:
                                 self.logger.warning(
-                                    f"⚠️  No data to process for RM {rm_data.river_mile}, "
-                                    f"Year {year}, Sensor {sensor}"
+                                    "⚠️  No data to process for RM %s, Year %s, Sensor %s",
+                                    rm_data.river_mile,
+                                    year,
+                                    sensor,
                                 )
                                 continue
 
+                            if grid:
+                                # Drawn together once the river mile is processed
+                                grid_entries.append((year, sensor, processed_data))
+                                continue
+
+                            digest = None
+                            if skip_unchanged:
+                                # Optimization: Hashing the plotted columns is far
+                                # cheaper than drawing and encoding the chart again
+                                digest = self.chart_generator.chart_digest(
+                                    processed_data, rm_data.river_mile, year, sensor
+                                )
+                                if self.chart_generator.is_chart_current(
+                                    self._chart_output_path(rm_data, year, sensor),
+                                    digest,
+                                ):
+                                    unchanged_count += 1
+                                    continue
+
                             # Generate chart
                             chart, chart_metrics = self.chart_generator.create_chart(
                                 processed_data, rm_data.river_mile, year, sensor
@@ -192,35 +263,63 @@ class Application:
 
                             if chart:
                                 if self._save_generated_chart(
-                                    chart, rm_data, year, sensor
+                                    chart, rm_data, year, sensor, digest
                                 ):
                                     success_count += 1
                                 else:
                                     error_count += 1
                             else:
                                 self.logger.error(
-                                    f"❌ Failed to create chart for RM {rm_data.river_mile}, "
-                                    f"Year {year}, Sensor {sensor}\n"
-                                    f"   💡 Check if the data contains valid numerical values."
+                                    "❌ Failed to create chart for RM %s, "
+                                    "Year %s, Sensor %s\n"
+                                    "   💡 Check if the data contains valid numerical values.",
+                                    rm_data.river_mile,
+                                    year,
+                                    sensor,
                                 )
                                 error_count += 1
 
                         except Exception as e:
                             self.logger.error(
-                                f"❌ Error processing RM {rm_data.river_mile}, "
-                                f"Year {year}, Sensor {sensor}: {str(e)}"
+                                "❌ Error processing RM %s, Year %s, Sensor %s: %s",
+                                rm_data.river_mile,
+                                year,
+                                sensor,
+                                e,
                             )
                             error_count += 1
                             continue
 
+                if grid_entries:
+                    if self._save_chart_grid(grid_entries, rm_data):
+                        success_count += 1
+                    else:
+                        error_count += 1
+
+            # Charts saved in the background were counted when queued
+            failed_saves = self.chart_generator.finish_saves()
+            success_count -= failed_saves
+            error_count += failed_saves
+
+            if unchanged_count:
+                self.logger.info(
+                    "⏭️  Skipped %s charts whose data is unchanged",
+                    format(unchanged_count, ","),
+                )
             self.logger.info(
-                f"🏁 Processed {success_count:,} charts successfully, {error_count:,} errors"
+                "🏁 Processed %s charts successfully, %s errors",
+                format(success_count, ","),
+                format(error_count, ","),
             )
             return error_count == 0
 
         except Exception as e:
-            self.logger.error(f"❌ Error processing data: {e}")
+            self.logger.error("❌ Error processing data: %s", e)
             return False
+        finally:
+            # The cached figure and any background savers are only needed while
+            # charts are being drawn; this also drains saves queued before an error
+            self.chart_generator.close()
 
     def run(self) -> bool:
         """
@@ -281,6 +380,28 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Base data directory (overrides HYDROGRAPH_BASE_DIR and the current directory)",
     )
+    parser.add_argument(
+        "--grid",
+        action="store_true",
+        help="Save one chart grid per river mile instead of one chart per year and sensor",
+    )
+    parser.add_argument(
+        "--save-workers",
+        type=int,
+        default=None,
+        help="Worker processes that save charts in the background (default: 1, no background saving)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes that parse river mile files (default: 1, serial; 0 uses one per CPU core)",
+    )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Do not redraw charts whose data and settings match the saved image",
+    )
     return parser
 
 
@@ -297,6 +418,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser = _build_parser()
     args = parser.parse_args(argv)
 
+    # Charts are only ever written to files: use the non-interactive Agg
+    # backend rather than whichever GUI backend the environment defaults to.
+    matplotlib.use("Agg")
+
     try:
         # Configure logging
         log_dir = Path("logs")
@@ -310,6 +435,14 @@ def main(argv: Optional[list[str]] = None) -> int:
 
         # Create and run application
         config = Config(base_dir=Path(args.data_dir)) if args.data_dir else Config()
+        if args.grid:
+            config.chart_settings.grid_per_river_mile = True
+        if args.save_workers is not None:
+            config.chart_settings.save_workers = args.save_workers
+        if args.skip_unchanged:
+            config.chart_settings.skip_unchanged = True
+        if args.workers is not None:
+            config.max_workers = args.workers or None
         app = Application(config=config)
         success = app.run()
 
@@ -321,7 +454,7 @@ def main(argv: Optional[list[str]] = None) -> int:
             return 1
 
     except Exception as e:
-        logging.error(f"Fatal error in main execution: {str(e)}")
+        logging.error("Fatal error in main execution: %s", e)
         return 1
 
 
@@ -3,7 +3,7 @@
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 
 @dataclass
@@ -23,6 +23,21 @@ class ChartSettings:
     figure_size: Tuple[int, int] = (12, 8)
     font_family: str = "Arial"
     font_size: int = 11
+    # Draw scatter markers as one raster image inside otherwise vector output
+    # (PDF/SVG), instead of one vector path per point
+    rasterize_markers: bool = True
+    # Plot at most this many markers per series, keeping each stretch's lowest
+    # and highest reading; None plots every point
+    max_points: Optional[int] = None
+    # Save one figure per river mile with a panel per (year, sensor) chart,
+    # instead of one file per chart
+    grid_per_river_mile: bool = False
+    # Worker processes that encode saved charts in the background while the
+    # next chart is drawn; 1 saves each chart in the calling process
+    save_workers: int = 1
+    # Skip redrawing a chart whose saved image was made from identical data and
+    # settings, as recorded in a digest file next to the image
+    skip_unchanged: bool = False
 
 
 @dataclass
@@ -36,6 +51,7 @@ class Config:
     data_dir: Path = field(init=False)
     raw_data_dir: Path = field(init=False)
     processed_dir: Path = field(init=False)
+    cache_dir: Path = field(init=False)
     output_dir: Path = field(init=False)
 
     summary_file: Path = field(init=False)
@@ -47,26 +63,36 @@ class Config:
     # SECURITY: Prevent DoS by limiting max file size loaded into memory
     max_file_size_bytes: int = 100 * 1024 * 1024  # 100 MB
 
+    # Worker processes used to parse and validate river mile files; 1 reads the
+    # files serially in the calling process and None uses one per CPU core.
+    max_workers: Optional[int] = 1
+
     def __post_init__(self) -> None:
-        """Initialize derived paths and ensure directories exist."""
+        """Initialize derived paths."""
         self.data_dir = self.base_dir / "data"
         self.raw_data_dir = self.data_dir / "raw"
         self.processed_dir = self.data_dir / "processed"
+        # Parsed Excel data, reused across runs while the source files are unchanged
+        self.cache_dir = self.data_dir / "cache"
         self.output_dir = self.base_dir / "output/charts"
 
-        # Ensure directories exist
-        self._ensure_directories()
-
         # Data file paths
         self.summary_file = self.raw_data_dir / "Data_Summary.xlsx"
         self.hydro_file = self.raw_data_dir / "Hydrograph_Seatek_Data.xlsx"
 
-    def _ensure_directories(self) -> None:
-        """Create directories if they don't exist."""
+    def ensure_directories(self) -> None:
+        """
+        Create the data and output directories if they don't exist.
+
+        Directory creation is deferred to this method (called from
+        ``Application.setup``) so that constructing a Config has no
+        filesystem side effects.
+        """
         for directory in [
             self.data_dir,
             self.raw_data_dir,
             self.processed_dir,
+            self.cache_dir,
             self.output_dir,
         ]:
             directory.mkdir(parents=True, exist_ok=True)
@@ -18,6 +18,11 @@ class FileLogConfig:
     backup_count: int = 5
 
 
+# Shared record layout. "{"-style templates are resolved with str.format_map
+# against the record dict, avoiding the %-operator dispatch for each record.
+LOG_FORMAT = "{asctime} - {name} - {levelname} - {message}"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 # Try to import colorlog, but provide fallback if not available
 try:
     import colorlog
@@ -56,9 +61,11 @@ def setup_logger(
 
     # Create formatters
     console_formatter: logging.Formatter
+    file_formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT, style="{")
+
     if HAS_COLORLOG and console:
         console_formatter = colorlog.ColoredFormatter(
-            "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            "{log_color}" + LOG_FORMAT,
             log_colors={
                 "DEBUG": "cyan",
                 "INFO": "green",
@@ -66,18 +73,12 @@ def setup_logger(
                 "ERROR": "red",
                 "CRITICAL": "red,bg_white",
             },
-            datefmt="%Y-%m-%d %H:%M:%S",
+            datefmt=DATE_FORMAT,
+            style="{",
         )
     else:
-        console_formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+        # Plain console output uses the same layout as the log file
+        console_formatter = file_formatter
 
     # Create console handler if requested
     if console:
@@ -2,15 +2,21 @@
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
 from ..core.config import Config
+from ..utils.cache import DataFrameCache
+from ..utils.excel import EXCEL_ENGINE
 from ..utils.security import validate_file_size
 
 logger = logging.getLogger(__name__)
 
+# Cache key of the list of RM_ sheets in the hydrograph workbook, so fully
+# cached runs never have to open the workbook to enumerate its sheets.
+SHEET_INDEX_KEY = "__rm_sheets__"
+
 
 class DataLoader:
     """Handles loading and initial validation of data files."""
@@ -23,6 +29,7 @@ class DataLoader:
             config: Application configuration
         """
         self.config = config
+        self.cache = DataFrameCache(config.cache_dir)
 
     def load_all_data(self) -> Tuple[pd.DataFrame, Dict[str, pd.DataFrame]]:
         """
@@ -41,7 +48,7 @@ class DataLoader:
             logger.debug("Data loading completed successfully")
             return summary_data, hydro_data
         except Exception as e:
-            logger.error(f"Error loading data: {str(e)}")
+            logger.error("Error loading data: %s", e)
             raise
 
     def _load_summary_data(self) -> pd.DataFrame:
@@ -58,7 +65,7 @@ class DataLoader:
         """
         try:
             summary_file = self.config.summary_file
-            logger.debug(f"Loading summary data from: {summary_file}")
+            logger.debug("Loading summary data from: %s", summary_file)
 
             # SECURITY: Limit file size to prevent memory exhaustion (DoS)
             validate_file_size(summary_file, self.config.max_file_size_bytes)
@@ -67,7 +74,15 @@ class DataLoader:
 
             # Optimize: load columns dynamically to avoid checking headers and reloading
             # This is an optimization for reading excel files in a single pass
-            df = pd.read_excel(summary_file, usecols=lambda col: col in required_cols)
+            cached = self.cache.load(summary_file)
+            if cached is not None:
+                df = cached
+            else:
+                df = pd.read_excel(
+                    summary_file,
+                    engine=EXCEL_ENGINE,
+                    usecols=lambda col: col in required_cols,
+                )
 
             missing_cols = [col for col in required_cols if col not in df.columns]
             if missing_cols:
@@ -77,12 +92,14 @@ class DataLoader:
 
             # Keep original validation for safety and consistency
             self._validate_columns(df, list(required_cols), "summary data")
+            if cached is None:
+                self.cache.store(summary_file, df)
 
-            logger.debug(f"Summary data loaded successfully. Shape: {df.shape}")
+            logger.debug("Summary data loaded successfully. Shape: %s", df.shape)
             return df
 
         except Exception as e:
-            logger.error(f"Error loading summary data: {str(e)}")
+            logger.error("Error loading summary data: %s", e)
             raise
 
     def _load_hydro_data(self) -> Dict[str, pd.DataFrame]:
@@ -99,42 +116,73 @@ class DataLoader:
         """
         try:
             hydro_file = self.config.hydro_file
-            logger.debug(f"Loading hydrograph data from: {hydro_file}")
+            logger.debug("Loading hydrograph data from: %s", hydro_file)
 
             # SECURITY: Limit file size to prevent memory exhaustion (DoS)
             validate_file_size(hydro_file, self.config.max_file_size_bytes)
 
-            hydro_data = {}
-            excel_file = pd.ExcelFile(hydro_file)
             required_cols = {"Time (Seconds)", "Year"}
+            frames: Dict[str, Optional[pd.DataFrame]] = {}
+            parsed: Set[str] = set()
+
+            # Serve every sheet from the cache when possible; the workbook is
+            # opened only if the sheet list or some sheet is not cached.
+            sheet_names = self._load_cached_sheet_names(hydro_file)
+            if sheet_names is not None:
+                frames = {
+                    name: self.cache.load(hydro_file, key=name) for name in sheet_names
+                }
+
+            if sheet_names is None or any(df is None for df in frames.values()):
+                # pandas opens the workbook in openpyxl read-only mode (or lazily
+                # with calamine): only the sheet index is read here, and each
+                # sheet is parsed on demand, so non-RM_ sheets are never loaded.
+                # Closing the handle on exit releases the zip archive and any
+                # parsed sheet state.
+                with pd.ExcelFile(hydro_file, engine=EXCEL_ENGINE) as excel_file:
+                    if sheet_names is None:
+                        sheet_names = [
+                            str(name)
+                            for name in excel_file.sheet_names
+                            if str(name).startswith("RM_")
+                        ]
+                        self.cache.store(
+                            hydro_file,
+                            pd.DataFrame({"sheet": sheet_names}),
+                            key=SHEET_INDEX_KEY,
+                        )
+
+                    for sheet_name_str in sheet_names:
+                        if frames.get(sheet_name_str) is not None:
+                            continue
+                        # Optimize: Load only required columns and sensor/hydrograph columns to reduce memory usage and speed up loading
+                        try:
+                            frames[sheet_name_str] = pd.read_excel(
+                                excel_file,
+                                sheet_name=sheet_name_str,
+                                usecols=lambda col: (
+                                    col in required_cols
+                                    or str(col).startswith("Sensor_")
+                                    or col == "Hydrograph (Lagged)"
+                                ),
+                            )
+                            parsed.add(sheet_name_str)
+                        except ValueError as exc:
+                            logger.warning("Skipping sheet %s: %s", sheet_name_str, exc)
 
-            for sheet_name in excel_file.sheet_names:
-                sheet_name_str = str(sheet_name)
-                if not sheet_name_str.startswith("RM_"):
-                    continue
-
-                # Optimize: Load only required columns and sensor/hydrograph columns to reduce memory usage and speed up loading
-                try:
-                    # SECURITY: Limit file size to prevent memory exhaustion (DoS)
-                    validate_file_size(hydro_file, self.config.max_file_size_bytes)
-
-                    df = pd.read_excel(
-                        excel_file,
-                        sheet_name=sheet_name_str,
-                        usecols=lambda col: (
-                            col in required_cols
-                            or str(col).startswith("Sensor_")
-                            or col == "Hydrograph (Lagged)"
-                        ),
-                    )
-                except ValueError as exc:
-                    logger.warning(f"Skipping sheet {sheet_name_str}: {exc}")
+            hydro_data = {}
+            for sheet_name_str in sheet_names:
+                df = frames.get(sheet_name_str)
+                if df is None:
                     continue
 
                 missing_cols = [col for col in required_cols if col not in df.columns]
                 if missing_cols:
                     logger.warning(
-                        f"Skipping sheet {sheet_name_str}: Missing required columns in sheet {sheet_name_str}: {missing_cols}"
+                        "Skipping sheet %s: Missing required columns in sheet %s: %s",
+                        sheet_name_str,
+                        sheet_name_str,
+                        missing_cols,
                     )
                     continue
 
@@ -143,9 +191,11 @@ class DataLoader:
                         df, list(required_cols), f"sheet {sheet_name_str}"
                     )
                     hydro_data[sheet_name_str] = df
-                    logger.debug(f"Loaded sheet {sheet_name_str}. Shape: {df.shape}")
+                    if sheet_name_str in parsed:
+                        self.cache.store(hydro_file, df, key=sheet_name_str)
+                    logger.debug("Loaded sheet %s. Shape: %s", sheet_name_str, df.shape)
                 except ValueError as e:
-                    logger.warning(f"Skipping sheet {sheet_name_str}: {str(e)}")
+                    logger.warning("Skipping sheet %s: %s", sheet_name_str, e)
                     continue
 
             if not hydro_data:
@@ -154,9 +204,24 @@ class DataLoader:
             return hydro_data
 
         except Exception as e:
-            logger.error(f"Error loading hydrograph data: {str(e)}")
+            logger.error("Error loading hydrograph data: %s", e)
             raise
 
+    def _load_cached_sheet_names(self, hydro_file: Path) -> Optional[List[str]]:
+        """
+        Return the cached list of RM_ sheet names in the hydrograph workbook.
+
+        Args:
+            hydro_file: Path to the hydrograph workbook
+
+        Returns:
+            Sheet names in workbook order, or None on a cache miss
+        """
+        sheet_index = self.cache.load(hydro_file, key=SHEET_INDEX_KEY)
+        if sheet_index is None or "sheet" not in sheet_index.columns:
+            return None
+        return [str(name) for name in sheet_index["sheet"]]
+
     @staticmethod
     def _validate_columns(
         df: pd.DataFrame, required_cols: List[str], context: str
@@ -203,6 +268,6 @@ class DataLoader:
                 rm_str = file_path.stem.split("_")[1]
                 river_miles.append(float(rm_str))
             except (IndexError, ValueError):
-                logger.warning(f"Skipping invalid river mile file: {file_path.name}")
+                logger.warning("Skipping invalid river mile file: %s", file_path.name)
 
         return sorted(river_miles)
@@ -6,6 +6,8 @@ and merges the two streams using a full outer join so that all valid sensor read
 """
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, cast
@@ -15,6 +17,8 @@ import numpy.typing as npt
 import pandas as pd
 
 from ..core.config import Config
+from ..utils.cache import DataFrameCache
+from ..utils.excel import EXCEL_ENGINE
 from ..utils.security import validate_file_size
 
 logger = logging.getLogger(__name__)
@@ -32,13 +36,20 @@ class ProcessingMetrics:
 
     def log_metrics(self) -> None:
         """Log processing metrics."""
+        # Called once per processed chart: pass the values as arguments so the
+        # message is only formatted if INFO records are actually emitted.
         logger.info(
             "Data processing metrics:\n"
-            f"  Original rows: {self.original_rows}\n"
-            f"  Invalid rows: {self.invalid_rows}\n"
-            f"  Zero values: {self.zero_values}\n"
-            f"  Null values: {self.null_values}\n"
-            f"  Valid rows: {self.valid_rows}"
+            "  Original rows: %d\n"
+            "  Invalid rows: %d\n"
+            "  Zero values: %d\n"
+            "  Null values: %d\n"
+            "  Valid rows: %d",
+            self.original_rows,
+            self.invalid_rows,
+            self.zero_values,
+            self.null_values,
+            self.valid_rows,
         )
 
 
@@ -77,62 +88,137 @@ class RiverMileData:
                 f"Invalid river mile file name: {self.file_path.name}"
             ) from e
 
-    def load_data(self, max_file_size_bytes: int = 100 * 1024 * 1024) -> None:
+    def load_data(
+        self,
+        max_file_size_bytes: int = 100 * 1024 * 1024,
+        cache: Optional[DataFrameCache] = None,
+    ) -> None:
         """
         Load and validate data from the Excel file.
 
         Args:
             max_file_size_bytes: Maximum allowed file size to prevent memory exhaustion
+            cache: Optional cache of previously parsed workbooks
 
         Raises:
             Exception: If the data cannot be loaded or validated
         """
         try:
-            # SECURITY: Limit file size to prevent memory exhaustion (DoS)
-            validate_file_size(self.file_path, max_file_size_bytes)
+            self.set_data(self.read_data(max_file_size_bytes, cache))
+        except Exception as e:
+            logger.error("Error loading %s: %s", self.file_path.name, e)
+            raise
+
+    def read_data(
+        self,
+        max_file_size_bytes: int = 100 * 1024 * 1024,
+        cache: Optional[DataFrameCache] = None,
+    ) -> pd.DataFrame:
+        """
+        Read, validate and downcast the sheet in the Excel file.
 
-            required_cols = {"Time (Seconds)", "Year"}
+        Args:
+            max_file_size_bytes: Maximum allowed file size to prevent memory exhaustion
+            cache: Optional cache of previously parsed workbooks
+
+        Returns:
+            The validated sheet, without derived columns
+
+        Raises:
+            Exception: If the data cannot be loaded or validated
+        """
+        # SECURITY: Limit file size to prevent memory exhaustion (DoS)
+        validate_file_size(self.file_path, max_file_size_bytes)
 
+        required_cols = {"Time (Seconds)", "Year"}
+
+        cached = cache.load(self.file_path) if cache is not None else None
+        if cached is not None:
+            self.data = cached
+        else:
             # Optimization: load columns dynamically and load in a single pass using stateless lambda
             self.data = pd.read_excel(
                 self.file_path,
+                engine=EXCEL_ENGINE,
                 usecols=lambda col: (
                     col in required_cols
                     or str(col).startswith("Sensor_")
                     or col == "Hydrograph (Lagged)"
                 ),
             )
-            cols = list(self.data.columns)
-
-            # Check required columns
-            missing = [c for c in required_cols if c not in cols]
-            if missing:
-                raise ValueError(f"Missing required columns: {set(missing)}")
-
-            # Find sensor columns
-            self.sensors = [col for col in cols if str(col).startswith("Sensor_")]
-            if not self.sensors:
-                raise ValueError("No sensor columns found")
-
-            # Keep original validation steps to ensure no methods are bypassed
-            self._validate_data()
-            self._setup_sensors()
-
-            # ⚡ Bolt Optimization: Pre-calculate Time (Minutes) once during data loading
-            # to avoid redundantly dividing Time (Seconds) by 60 for every sensor and year combination
-            self.data["Time (Minutes)"] = (
-                self.data["Time (Seconds)"].to_numpy(dtype=np.float64) / 60.0
+
+        self._validate_data()
+        self._setup_sensors()
+
+        # Optimization: Store numeric sensor and hydrograph readings as float32.
+        # They carry ~3 significant decimals, so this halves the bytes every
+        # per-sensor pass moves; the NAVD88 conversion still computes in
+        # float64. Time stays float64, where float32 would lose whole seconds
+        # over a year of readings.
+        reading_cols = [
+            col
+            for col in [*self.sensors, "Hydrograph (Lagged)"]
+            if col in self.data.columns
+            and pd.api.types.is_numeric_dtype(self.data[col])
+        ]
+        downcasts: Dict[str, Any] = dict.fromkeys(reading_cols, np.float32)
+        # Year is a small integer key; int16 gives groupby a quarter of the
+        # int64 bytes to hash when the year blocks are built below.
+        years = self.data["Year"]
+        if pd.api.types.is_integer_dtype(years) and (
+            years.empty
+            or (
+                np.iinfo(np.int16).min <= years.min()
+                and years.max() <= np.iinfo(np.int16).max
             )
+        ):
+            downcasts["Year"] = np.int16
+        data = self.data.astype(downcasts)
+        self.data = data
 
-            # Optimization: Pre-group data by year to avoid O(N) boolean masking
-            # for each sensor during data processing.
-            self.year_data_cache = {}
-            for raw_year, df in self.data.groupby("Year", sort=False):
-                year = int(cast(int, raw_year))
-                self.year_data_cache[year] = df
-        except Exception as e:
-            logger.error(f"Error loading {self.file_path.name}: {str(e)}")
-            raise
+        # Cache the validated sheet before adding derived columns
+        if cache is not None and cached is None:
+            cache.store(self.file_path, data)
+        return data
+
+    def set_data(self, data: pd.DataFrame) -> None:
+        """
+        Adopt a sheet returned by ``read_data`` and index it by year.
+
+        Args:
+            data: Validated sheet of this river mile
+
+        Raises:
+            ValueError: If required or sensor columns are missing
+        """
+        self.data = data
+        self._validate_data()
+        self._setup_sensors()
+
+        # ⚡ Bolt Optimization: Pre-calculate Time (Minutes) once during data loading
+        # to avoid redundantly dividing Time (Seconds) by 60 for every sensor and year combination
+        self.data["Time (Minutes)"] = (
+            self.data["Time (Seconds)"].to_numpy(dtype=np.float64) / 60.0
+        )
+
+        # Optimization: Pre-group data by year to avoid O(N) boolean masking
+        # for each sensor during data processing. The group row positions
+        # come straight from groupby().indices, and each year is gathered
+        # with a single take() in time order, so process_data results come
+        # out already sorted and its monotonic check never has to sort.
+        self.year_data_cache = {}
+        times = self.data["Time (Seconds)"].to_numpy()
+        year_rows = self.data.groupby("Year", sort=False).indices
+        # The year is the cache key and constant within a block, so the
+        # blocks only carry the time and reading columns process_data reads.
+        block_source = self.data.drop(columns="Year")
+        for raw_year, rows in year_rows.items():
+            positions = np.asarray(rows, dtype=np.intp)
+            year_times = times[positions]
+            if not np.all(year_times[1:] >= year_times[:-1]):
+                positions = positions[np.argsort(year_times, kind="stable")]
+            year = int(cast(int, raw_year))
+            self.year_data_cache[year] = block_source.take(positions)
 
     def _validate_data(self) -> None:
         """
@@ -158,7 +244,7 @@ class RiverMileData:
             ValueError: If no sensor columns are found
         """
         self.sensors = (
-            [col for col in self.data.columns if col.startswith("Sensor_")]
+            [col for col in self.data.columns if str(col).startswith("Sensor_")]
             if self.data is not None
             else []
         )
@@ -166,6 +252,28 @@ class RiverMileData:
             raise ValueError("No sensor columns found")
 
 
+def _read_river_mile_file(
+    file_path: Path, max_file_size_bytes: int, cache_dir: Path
+) -> pd.DataFrame:
+    """
+    Read one river mile file; defined at module level so worker processes can run it.
+
+    Only the parsed sheet is returned: the per-year blocks are built by the
+    caller, so they never have to be pickled across the process boundary.
+
+    Args:
+        file_path: Path to the river mile Excel file
+        max_file_size_bytes: Maximum allowed file size to prevent memory exhaustion
+        cache_dir: Directory of the parsed-workbook cache
+
+    Returns:
+        The validated river mile sheet
+    """
+    return RiverMileData(file_path).read_data(
+        max_file_size_bytes=max_file_size_bytes, cache=DataFrameCache(cache_dir)
+    )
+
+
 @dataclass
 class SeatekDataProcessor:
     """
@@ -186,10 +294,13 @@ class SeatekDataProcessor:
     config: Config
     river_mile_data: Dict[float, RiverMileData] = field(default_factory=dict)
     offsets: Dict[float, float] = field(default_factory=dict)
+    _navd88_scale: float = field(init=False, repr=False)
+    _navd88_bias: float = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Initialize processor after creation."""
         self._setup_offsets()
+        self._setup_navd88_coefficients()
 
     def _setup_offsets(self) -> None:
         """Setup Y_Offset values for each river mile from the summary data."""
@@ -197,6 +308,20 @@ class SeatekDataProcessor:
             zip(self.summary_data["River_Mile"], self.summary_data["Y_Offset"])
         )
 
+    def _setup_navd88_coefficients(self) -> None:
+        """
+        Fold the NAVD88 constants into one scale and a river-mile-independent bias.
+
+        Math simplification:
+        -(raw_data + A - B) * C + D  ==>  raw_data * (-C) + (D - (A - B) * C)
+        so each conversion only adds its river mile's offset D to the bias.
+        """
+        constants = self.config.navd88_constants
+        self._navd88_scale = -constants.scale_factor
+        self._navd88_bias = (
+            constants.offset_a - constants.offset_b
+        ) * self._navd88_scale
+
     def convert_to_navd88(
         self, data: pd.DataFrame, sensor: str, river_mile: float, copy: bool = True
     ) -> pd.DataFrame:
@@ -219,7 +344,10 @@ class SeatekDataProcessor:
             DataFrame with converted sensor readings. When ``copy=False``,
             the returned DataFrame is the same object as the input ``data``.
         """
-        processed = data.copy() if copy else data
+        # Optimization: Under copy-on-write a shallow copy already isolates the
+        # caller's frame; the columns assigned below replace data in the new frame
+        # only, so a deep copy of every column would be wasted memcpy.
+        processed = data.copy(deep=False) if copy else data
         y_offset = self.offsets.get(river_mile, 0)
 
         # ⚡ Bolt Optimization: Ensure Time (Minutes) is calculated if missing.
@@ -239,16 +367,17 @@ class SeatekDataProcessor:
             raw_data = processed[sensor]
         else:
             raw_data = pd.to_numeric(processed[sensor], errors="coerce")
-        # Get conversion constants from config
-        constants = self.config.navd88_constants
-
-        # Optimization: Pre-calculate scalar coefficients to minimize memory allocations
-        # and array operations. Math simplification:
-        # -(raw_data + A - B) * C + D  ==>  raw_data * (-C) + (D - (A - B) * C)
-        m = -constants.scale_factor
-        b = y_offset + (constants.offset_a - constants.offset_b) * m
-
-        processed[sensor] = raw_data.to_numpy(dtype=np.float64) * m + b
+        # Optimization: Scalar coefficients are folded once in __post_init__
+        m = self._navd88_scale
+        b = y_offset + self._navd88_bias
+
+        # Optimization: Fuse the affine transform into one owned buffer updated in
+        # place, instead of allocating a temporary for the product and another
+        # for the sum.
+        values = raw_data.to_numpy(dtype=np.float64, copy=True)
+        values *= m
+        values += b
+        processed[sensor] = values
 
         return processed
 
@@ -314,14 +443,38 @@ class SeatekDataProcessor:
         else:
             # Optimization: Only extract the required columns (Time, current sensor, and Hydrograph)
             # to avoid redundantly copying all other sensor columns on every iteration.
+            # Column selection already returns a new frame (copy-on-write), so the
+            # NAVD88 conversion below cannot write through to the cache.
             cols = ["Time (Seconds)", "Time (Minutes)", sensor]
             if "Hydrograph (Lagged)" in cached_year_data.columns:
                 cols.append("Hydrograph (Lagged)")
-            year_data = cached_year_data[cols].copy()
+            year_data = cached_year_data[cols]
 
         metrics = ProcessingMetrics(original_rows=len(year_data))
         return year_data, metrics
 
+    @staticmethod
+    def _nonzero_valid_mask(series: pd.Series) -> npt.NDArray[np.bool_]:
+        """Return a mask of values that are neither null nor zero.
+
+        Args:
+            series: Numeric column to check.
+
+        Returns:
+            Boolean array that is ``True`` where the value is valid.
+        """
+        values = series.to_numpy()
+        # Optimization: Integer columns cannot hold NaN, so skip the float64
+        # upcast copy and the isnan pass; float columns are used as a view.
+        mask: npt.NDArray[np.bool_]
+        if values.dtype.kind in "iu":
+            mask = values != 0
+        else:
+            if values.dtype.kind != "f":
+                values = series.to_numpy(dtype=np.float64)
+            mask = ~(np.isnan(values) | (values == 0))
+        return mask
+
     def _compute_validity_masks(
         self, processed: pd.DataFrame, sensor: str
     ) -> Tuple[npt.NDArray[np.bool_], Optional[npt.NDArray[np.bool_]], int, int]:
@@ -339,8 +492,7 @@ class SeatekDataProcessor:
 
         has_hydro = "Hydrograph (Lagged)" in processed.columns
         if has_hydro:
-            hydro_vals = processed["Hydrograph (Lagged)"].to_numpy(dtype=np.float64)
-            hydro_mask_arr = ~(np.isnan(hydro_vals) | (hydro_vals == 0))
+            hydro_mask_arr = self._nonzero_valid_mask(processed["Hydrograph (Lagged)"])
 
         return (
             sensor_mask_arr,
@@ -385,18 +537,17 @@ class SeatekDataProcessor:
         sensor: str,
         sensor_mask_arr: npt.NDArray[np.bool_],
         hydro_mask_arr: Optional[npt.NDArray[np.bool_]],
+        sensor_any: bool,
+        hydro_any: bool,
     ) -> pd.DataFrame:
         has_hydro = "Hydrograph (Lagged)" in processed.columns
-        sensor_any = bool(sensor_mask_arr.any())
 
         keep_mask_arr = sensor_mask_arr
-        hydro_any = False
-
         if has_hydro and hydro_mask_arr is not None:
-            hydro_any = bool(hydro_mask_arr.any())
             keep_mask_arr = sensor_mask_arr | hydro_mask_arr
 
-        merged = processed[keep_mask_arr].copy()
+        # Boolean row selection already yields a new frame; no extra copy needed
+        merged = processed[keep_mask_arr]
         sensor_keep_arr = sensor_mask_arr[keep_mask_arr]
 
         self._apply_sensor_sentinels(merged, sensor, sensor_keep_arr, has_hydro)
@@ -482,6 +633,8 @@ class SeatekDataProcessor:
             sensor,
             sensor_mask_arr,
             hydro_mask_arr,
+            sensor_any,
+            hydro_any,
         )
 
         # Optimization: Check if already sorted (O(N)) before doing O(N log N) sort
@@ -508,18 +661,55 @@ class SeatekDataProcessor:
             if not rm_files:
                 raise FileNotFoundError("No valid river mile files found")
 
+            max_workers = min(
+                len(rm_files), self.config.max_workers or os.cpu_count() or 1
+            )
+            loaded: Dict[Path, pd.DataFrame] = {}
+
+            if max_workers <= 1:
+                for file_path in rm_files:
+                    try:
+                        loaded[file_path] = _read_river_mile_file(
+                            file_path,
+                            self.config.max_file_size_bytes,
+                            self.config.cache_dir,
+                        )
+                    except Exception as e:
+                        logger.error("Error loading %s: %s", file_path.name, e)
+            else:
+                # Optimization: Excel parsing is CPU bound, so parse the files in
+                # parallel worker processes; each failure is logged per file.
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(
+                            _read_river_mile_file,
+                            file_path,
+                            self.config.max_file_size_bytes,
+                            self.config.cache_dir,
+                        ): file_path
+                        for file_path in rm_files
+                    }
+                    for future in as_completed(futures):
+                        file_path = futures[future]
+                        try:
+                            loaded[file_path] = future.result()
+                        except Exception as e:
+                            logger.error("Error loading %s: %s", file_path.name, e)
+
+            # Insert in file order so iteration order does not depend on timing
             for file_path in rm_files:
+                if file_path not in loaded:
+                    continue
+                rm_data = RiverMileData(file_path)
                 try:
-                    rm_data = RiverMileData(file_path)
-                    rm_data.load_data(
-                        max_file_size_bytes=self.config.max_file_size_bytes
-                    )
-                    self.river_mile_data[rm_data.river_mile] = rm_data
-                    logger.info(f"Loaded data for River Mile {rm_data.river_mile}")
+                    rm_data.set_data(loaded.pop(file_path))
                 except Exception as e:
-                    logger.error(f"Error loading {file_path.name}: {str(e)}")
+                    logger.error("Error loading %s: %s", file_path.name, e)
+                    continue
+                self.river_mile_data[rm_data.river_mile] = rm_data
+                logger.info("Loaded data for River Mile %s", rm_data.river_mile)
         except Exception as e:
-            logger.error(f"Error loading data: {str(e)}")
+            logger.error("Error loading data: %s", e)
             raise
 
     def _find_river_mile_files(self) -> List[Path]:
@@ -5,12 +5,16 @@ Data validation utilities for Seatek sensor data.
 """
 
 import logging
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from ..core.config import Config
+from ..utils.excel import EXCEL_ENGINE
 from ..utils.security import validate_file_size
 
 logger = logging.getLogger(__name__)
@@ -67,12 +71,16 @@ class DataValidator:
             required_cols = {"River_Mile", "Y_Offset", "Num_Sensors"}
 
             # Optimization: load columns dynamically and validate headers in a single pass using stateless lambda
-            df = pd.read_excel(summary_file, usecols=lambda col: col in required_cols)
+            df = pd.read_excel(
+                summary_file,
+                engine=EXCEL_ENGINE,
+                usecols=lambda col: col in required_cols,
+            )
             columns = list(df.columns)
 
             missing = [col for col in required_cols if col not in columns]
             if missing:
-                logger.error(f"Missing required columns in summary data: {missing}")
+                logger.error("Missing required columns in summary data: %s", missing)
                 return None
 
             # Check data types
@@ -89,7 +97,7 @@ class DataValidator:
             missing_values = self._calculate_missing_values(df, required_cols)
             if any(val > 0 for val in missing_values.values()):
                 logger.warning(
-                    f"Missing values detected in summary data: {missing_values}"
+                    "Missing values detected in summary data: %s", missing_values
                 )
 
             return {
@@ -102,7 +110,7 @@ class DataValidator:
             }
 
         except Exception as e:
-            logger.error(f"Error validating summary file: {str(e)}")
+            logger.error("Error validating summary file: %s", e)
             return None
 
     def _extract_hydro_years(self, df: pd.DataFrame) -> Optional[List[int]]:
@@ -133,10 +141,8 @@ class DataValidator:
         """Helper to extract time range safely."""
         return self._extract_range(df, "Time (Seconds)", float)
 
-    def _process_hydro_sheet(
-        self, excel: Any, hydro_file: Any, sheet: str
-    ) -> Dict[str, Any]:
-        """Process a single hydrograph sheet."""
+    def _process_hydro_sheet(self, excel: Any, sheet: str) -> Dict[str, Any]:
+        """Process a single hydrograph sheet from an already opened workbook."""
         required_cols = {"Time (Seconds)", "Year"}
 
         # Optimization: check headers and conditionally load only required in single pass.
@@ -145,9 +151,8 @@ class DataValidator:
             lambda c: c in required_cols
         )
 
-        # SECURITY: Limit file size to prevent memory exhaustion (DoS)
-        validate_file_size(hydro_file, self.config.max_file_size_bytes)
-
+        # Optimization: Read from the shared ExcelFile handle so the workbook archive
+        # is parsed once. The file size was already validated before it was opened.
         df = pd.read_excel(excel, sheet_name=sheet, usecols=filter_cols)
         columns = list(seen_cols)
         missing = [col for col in required_cols if col not in columns]
@@ -181,7 +186,7 @@ class DataValidator:
                 logger.error(str(e))
                 return None
 
-            with pd.ExcelFile(hydro_file) as excel:
+            with pd.ExcelFile(hydro_file, engine=EXCEL_ENGINE) as excel:
                 sheets = excel.sheet_names
                 rm_sheets = [
                     s for s in sheets if isinstance(s, str) and s.startswith("RM_")
@@ -192,8 +197,7 @@ class DataValidator:
                     return None
 
                 sheet_info = [
-                    self._process_hydro_sheet(excel, hydro_file, sheet)
-                    for sheet in rm_sheets
+                    self._process_hydro_sheet(excel, sheet) for sheet in rm_sheets
                 ]
 
                 return {
@@ -203,7 +207,7 @@ class DataValidator:
                 }
 
         except Exception as e:
-            logger.error(f"Error validating hydrograph file: {str(e)}")
+            logger.error("Error validating hydrograph file: %s", e)
             return None
 
     def _extract_processed_year_range(self, df: pd.DataFrame) -> Optional[List[int]]:
@@ -221,16 +225,18 @@ class DataValidator:
             rm_str = file_path.stem.split("_")[1]
             river_mile = float(rm_str)
         except (IndexError, ValueError):
-            logger.warning(f"Invalid river mile file name: {file_path.name}")
+            logger.warning("Invalid river mile file name: %s", file_path.name)
             river_mile = None
 
-        # Optimization: load columns dynamically and load in a single pass.
-        # First column is unconditionally included as an anchor so df may include a column that is neither required nor a Sensor_ column.
+        # Optimization: every header passes through the filter, so the sensor
+        # columns are listed from their names alone and only the required
+        # columns are parsed. The first column is unconditionally included as
+        # an anchor so df is never empty and its row count is reliable.
         filter_cols, seen_cols = self._create_stateful_col_filter(
-            lambda c: c in required_cols or str(c).startswith("Sensor_")
+            lambda c: c in required_cols
         )
 
-        df = pd.read_excel(file_path, usecols=filter_cols)
+        df = pd.read_excel(file_path, engine=EXCEL_ENGINE, usecols=filter_cols)
         columns = list(seen_cols)
 
         missing = [col for col in required_cols if col not in columns]
@@ -251,43 +257,63 @@ class DataValidator:
             "time_range": time_range,
         }
 
-    def validate_processed_files(self) -> List[Dict[str, Any]]:
+    def _validate_processed_path(self, file_path: Path) -> Dict[str, Any]:
+        """Validate one processed file, returning an error entry if it fails."""
+        try:
+            # SECURITY: Limit file size to prevent memory exhaustion (DoS)
+            try:
+                validate_file_size(file_path, self.config.max_file_size_bytes)
+            except (ValueError, FileNotFoundError) as e:
+                logger.error(str(e))
+                return {"file": file_path.name, "error": str(e)}
+
+            return self._process_processed_file(file_path, {"Time (Seconds)", "Year"})
+        except Exception as e:
+            logger.error("Error validating processed file %s: %s", file_path.name, e)
+            return {"file": file_path.name, "error": str(e)}
+
+    def iter_processed_files(self) -> Iterator[Dict[str, Any]]:
         """
-        Validate processed river mile files.
+        Validate processed river mile files, yielding results in file order.
 
-        Returns:
-            List of dictionaries with validation results for each file
+        By default each file is validated in the calling process and its
+        DataFrame is released before the next file is read, so a caller that
+        consumes results as they are yielded only ever holds one file's data.
+        Callers that opt in to more workers through ``Config.max_workers`` have
+        the files parsed in worker processes instead.
+
+        Yields:
+            Dictionary with validation results for each file
         """
-        results: List[Dict[str, Any]] = []
         processed_dir = self.config.processed_dir
 
         if not processed_dir.exists():
-            logger.error(f"Processed directory not found: {processed_dir}")
-            return results
+            logger.error("Processed directory not found: %s", processed_dir)
+            return
 
         rm_files = list(processed_dir.glob("RM_*.xlsx"))
-        required_cols = {"Time (Seconds)", "Year"}
+        max_workers = min(len(rm_files), self.config.max_workers or os.cpu_count() or 1)
 
-        for file_path in rm_files:
-            try:
-                # SECURITY: Limit file size to prevent memory exhaustion (DoS)
-                try:
-                    validate_file_size(file_path, self.config.max_file_size_bytes)
-                except (ValueError, FileNotFoundError) as e:
-                    logger.error(str(e))
-                    results.append({"file": file_path.name, "error": str(e)})
-                    continue
-
-                res = self._process_processed_file(file_path, required_cols)
-                results.append(res)
-
-            except Exception as e:
-                logger.error(
-                    f"Error validating processed file {file_path.name}: {str(e)}"
-                )
-                results.append({"file": file_path.name, "error": str(e)})
+        if max_workers <= 1:
+            for file_path in rm_files:
+                yield self._validate_processed_path(file_path)
+            return
+
+        # Optimization: Excel parsing is CPU bound, so validate the files in
+        # parallel worker processes; map() keeps the results in file order.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(
+                _validate_processed_file, repeat(self.config), rm_files
+            )
 
-        return results
+    def validate_processed_files(self) -> List[Dict[str, Any]]:
+        """
+        Validate processed river mile files.
+
+        Returns:
+            List of dictionaries with validation results for each file
+        """
+        return list(self.iter_processed_files())
 
     def run_validation(self) -> Dict[str, Any]:
         """
@@ -335,3 +361,17 @@ class DataValidator:
                 and len(processed_validation) > 0
             ),
         }
+
+
+def _validate_processed_file(config: Config, file_path: Path) -> Dict[str, Any]:
+    """
+    Validate one processed file; defined at module level so worker processes can run it.
+
+    Args:
+        config: Application configuration
+        file_path: Path to the processed river mile file
+
+    Returns:
+        Dictionary with validation results, or an error entry if it fails
+    """
+    return DataValidator(config)._validate_processed_path(file_path)
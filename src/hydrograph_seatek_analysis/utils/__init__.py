@@ -1 +1 @@
-"""Security helpers for the Hydrograph and Seatek Sensor Analysis package."""
+"""Utility helpers for the Hydrograph and Seatek Sensor Analysis package."""
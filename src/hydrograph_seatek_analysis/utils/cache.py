@@ -0,0 +1,103 @@
+"""On-disk cache of parsed DataFrames for the Seatek data processing pipeline."""
+
+import hashlib
+import logging
+import os
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Parquet support comes from pyarrow; without it the cache is a no-op.
+HAS_PARQUET = find_spec("pyarrow") is not None
+
+# Part of every cache key. Bump it whenever the loaders change what they store
+# (selected columns, dtype downcasts, validation) so older entries are ignored.
+CACHE_VERSION = 1
+
+
+class DataFrameCache:
+    """
+    Cache DataFrames parsed from Excel files as Parquet files.
+
+    Entries are keyed by ``CACHE_VERSION``, the source file's resolved path,
+    modification time and size plus a caller-supplied key, so editing or
+    replacing a workbook invalidates its entries automatically. Caching is best
+    effort: it is disabled when pyarrow is missing or the cache directory does
+    not exist, and any read or write failure falls back to parsing the Excel
+    file.
+    """
+
+    def __init__(self, cache_dir: Path):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached Parquet files. It is created
+                by ``Config.ensure_directories``; the cache never creates it.
+        """
+        self.cache_dir = cache_dir
+
+    @property
+    def enabled(self) -> bool:
+        """Whether cached entries can be read and written."""
+        # os.path.isdir never raises, unlike Path.is_dir on an unusable stat result
+        return HAS_PARQUET and os.path.isdir(self.cache_dir)
+
+    def _entry_path(self, source: Path, key: str) -> Path:
+        """Return the cache file for ``key`` in the current version of ``source``."""
+        stat = source.stat()
+        signature = (
+            f"{CACHE_VERSION}|{source.resolve()}|{stat.st_mtime_ns}|"
+            f"{stat.st_size}|{key}"
+        )
+        digest = hashlib.sha256(signature.encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{source.stem}_{digest}.parquet"
+
+    def load(self, source: Path, key: str = "") -> Optional[pd.DataFrame]:
+        """
+        Return the cached DataFrame for ``source`` and ``key``, if any.
+
+        Args:
+            source: Excel file the DataFrame was parsed from.
+            key: Distinguishes multiple DataFrames parsed from one file,
+                e.g. a sheet name.
+
+        Returns:
+            The cached DataFrame, or None on a cache miss.
+        """
+        try:
+            if not self.enabled:
+                return None
+            entry = self._entry_path(source, key)
+            if not entry.is_file():
+                return None
+            df = pd.read_parquet(entry)
+        except Exception as e:
+            logger.debug("Ignoring unreadable cache entry for %s: %s", source.name, e)
+            return None
+        logger.debug("Loaded %s [%s] from cache", source.name, key)
+        return df
+
+    def store(self, source: Path, df: pd.DataFrame, key: str = "") -> None:
+        """
+        Cache ``df`` as parsed from ``source``.
+
+        Args:
+            source: Excel file the DataFrame was parsed from.
+            df: Parsed DataFrame to cache.
+            key: Distinguishes multiple DataFrames parsed from one file.
+        """
+        try:
+            if not self.enabled:
+                return
+            entry = self._entry_path(source, key)
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_entry = entry.with_suffix(".tmp")
+            df.to_parquet(tmp_entry, compression="zstd")
+            tmp_entry.replace(entry)
+        except Exception as e:
+            logger.debug("Could not cache %s [%s]: %s", source.name, key, e)
@@ -0,0 +1,11 @@
+"""Excel reader selection for the Seatek data processing pipeline."""
+
+from importlib.util import find_spec
+from typing import Literal
+
+# Optimization: Prefer the Rust-based calamine reader when python-calamine is
+# installed; it parses these workbooks roughly twice as fast as openpyxl with a
+# smaller memory footprint. openpyxl stays the always-available fallback.
+EXCEL_ENGINE: Literal["calamine", "openpyxl"] = (
+    "calamine" if find_spec("python_calamine") is not None else "openpyxl"
+)
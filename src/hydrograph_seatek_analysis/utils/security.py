@@ -12,15 +12,11 @@ logger = logging.getLogger(__name__)
 # This ensures that any downstream libraries (like openpyxl/pandas) are also protected.
 defusedxml.defuse_stdlib()  # type: ignore[attr-defined]
 
-
-def _check_is_regular_file(file_path: Path) -> None:
-    """Check if path is a regular file safely."""
-    try:
-        if not file_path.is_file():
-            raise ValueError(f"Path is not a regular file: {file_path}")
-    except TypeError:
-        # Gracefully handle poorly mocked test environments where pathlib.Path.stat() lacks st_mode
-        pass
+# Optimization: Characters outside word characters, dashes, dots, and whitespace,
+# and runs of two or more dots (directory traversal), are both replaced with "_".
+# The replacement never produces a dot, so one precompiled pass is equivalent to
+# applying the two substitutions in sequence.
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\-\.\s]|\.{2,}")
 
 
 def validate_file_size(file_path: Path, max_size_bytes: int) -> None:
@@ -37,15 +33,18 @@ def validate_file_size(file_path: Path, max_size_bytes: int) -> None:
     if file_path.is_symlink():
         raise ValueError(f"File is a symbolic link: {file_path}")
 
+    # is_file() stats the target and only succeeds for regular files, so no
+    # further type check (and extra stat syscall) is needed before sizing it.
     if not file_path.is_file():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    _check_is_regular_file(file_path)
-
     file_size = file_path.stat().st_size
     if file_size > max_size_bytes:
         logger.error(
-            f"File {file_path.name} size ({file_size} bytes) exceeds maximum limit ({max_size_bytes} bytes)"
+            "File %s size (%s bytes) exceeds maximum limit (%s bytes)",
+            file_path.name,
+            file_size,
+            max_size_bytes,
         )
         raise ValueError(
             f"File {file_path.name} exceeds maximum size of {max_size_bytes} bytes"
@@ -66,18 +65,12 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     if not isinstance(filename, str):
         filename = str(filename)
 
-    # Keep only word characters (letters, digits, underscore), dashes, dots, and whitespace
-    sanitized = re.sub(r"[^\w\-\.\s]", "_", filename)
-    # Prevent directory traversal dots like ..
-    sanitized = re.sub(r"\.{2,}", "_", sanitized)
-    # Strip leading/trailing whitespaces and dots
-    sanitized = sanitized.strip(". ")
+    # Neutralize unsafe characters and traversal dots, then strip leading/trailing
+    # whitespace and dots; fall back to a placeholder if nothing is left
+    sanitized = _UNSAFE_FILENAME_RE.sub("_", filename).strip(". ") or "unknown"
 
-    # Ensure we never return an empty filename after sanitization
-    if not sanitized:
-        sanitized = "unknown"
     # SECURITY: Limit filename length to prevent path-length DoS or file system errors
-    return (sanitized or "_")[:max_length]
+    return sanitized[:max_length]
 
 
 def is_safe_path(base_dir: Path, target_path: Path) -> bool:
@@ -1,17 +1,25 @@
 """Chart generation utilities for Seatek data visualization."""
 
+import hashlib
 import logging
+import math
+import pickle
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, List, Optional, Sequence, Set, Tuple
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 import matplotlib.ticker as ticker
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
-import seaborn as sns
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
+from matplotlib.typing import RcKeyType
 
+from .. import __version__
 from ..core.config import ChartSettings, Config
 
 logger = logging.getLogger(__name__)
@@ -21,6 +29,129 @@ HYDRO_COLOR = "#0E5A8A"
 HYDROGRAPH_COL = "Hydrograph (Lagged)"
 MARKER_EDGE_COLOR = "white"
 MARKER_EDGE_LINEWIDTH = 0.5
+# Marker diameters in points, matching scatter areas of 45 and 70 points²
+SENSOR_MARKER_SIZE = math.sqrt(45)
+HYDRO_MARKER_SIZE = math.sqrt(70)
+# Size of one panel of a chart grid, in inches
+GRID_PANEL_SIZE = (6.0, 4.0)
+# Most pixels a saved chart grid may have (about two single 12x8 in charts at
+# 300 dpi); larger grids are saved at a proportionally lower dpi so a river
+# mile with many panels does not cost more to render than its separate charts
+GRID_MAX_PIXELS = 16_000_000
+
+
+def sensor_number(sensor: str) -> str:
+    """Return the number part of a sensor column name, e.g. "1" for "Sensor_1"."""
+    return sensor.split("_", 2)[1] if "_" in sensor else sensor
+
+
+# The seaborn "whitegrid" style with this package's grid and edge overrides,
+# as plain rcParams so rendering charts does not need to import seaborn
+BASE_STYLE: dict[RcKeyType, Any] = {
+    "axes.axisbelow": True,
+    "axes.edgecolor": "#333333",
+    "axes.grid": True,
+    "axes.labelcolor": ".15",
+    "grid.color": "#CCCCCC",
+    "grid.linestyle": ":",
+    "lines.solid_capstyle": "round",
+    "patch.edgecolor": "w",
+    "patch.force_edgecolor": True,
+    "text.color": ".15",
+    "xtick.bottom": False,
+    "xtick.color": ".15",
+    "ytick.color": ".15",
+    "ytick.left": False,
+}
+
+# Settings-dependent rcParams most recently applied by a ChartGenerator
+_applied_rc_settings: Optional[dict[RcKeyType, Any]] = None
+
+
+def _downsample_extremes(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64], max_points: Optional[int]
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Reduce a series to at most ``max_points`` points, keeping its extremes.
+
+    The points are split into ``max_points // 2`` consecutive buckets and the
+    lowest and highest reading of each bucket are kept, in their original
+    order, so spikes and dips survive where plain striding could drop them.
+
+    Args:
+        x: Point x values, in plotting order
+        y: Point y values without NaNs
+        max_points: Point budget; None or a series within budget is returned as is
+
+    Returns:
+        The kept x and y values
+    """
+    n_points = len(y)
+    if max_points is None or n_points <= max_points or max_points < 2:
+        return x, y
+
+    n_buckets = max_points // 2
+    edges = np.linspace(0, n_points, n_buckets + 1).astype(np.intp)
+    bucket_ids = np.repeat(np.arange(n_buckets), np.diff(edges))
+    # Sorting by (bucket, y) puts each bucket's minimum at its first position
+    # and its maximum at its last
+    order = np.lexsort((y, bucket_ids))
+    keep = np.union1d(order[edges[:-1]], order[edges[1:] - 1])
+    return x[keep], y[keep]
+
+
+def _digest_path(output_path: Path) -> Path:
+    """Return the sidecar file recording the digest of a saved chart's inputs."""
+    return output_path.with_name(f"{output_path.name}.digest")
+
+
+def _write_chart(
+    fig: Figure,
+    output_path: Path,
+    dpi: int,
+    metadata: Optional[dict[str, str]],
+    digest: Optional[str],
+) -> None:
+    """
+    Save a figure and record the digest of its inputs next to it.
+
+    Any previous digest is removed before saving, so an image saved without a
+    digest, or left behind by a failed save, is never reported as current.
+
+    Args:
+        fig: Figure to save
+        output_path: Path to save the figure to
+        dpi: Output resolution
+        metadata: Optional image metadata
+        digest: Optional digest of the chart's inputs
+    """
+    _digest_path(output_path).unlink(missing_ok=True)
+    fig.savefig(output_path, dpi=dpi, metadata=metadata)
+    if digest is not None:
+        _digest_path(output_path).write_text(digest)
+
+
+def _save_pickled_figure(
+    payload: bytes,
+    output_path: Path,
+    dpi: int,
+    metadata: Optional[dict[str, str]],
+    digest: Optional[str] = None,
+) -> None:
+    """
+    Unpickle a figure and save it; defined at module level so worker processes can run it.
+
+    Args:
+        payload: Pickled Figure
+        output_path: Path to save the figure to
+        dpi: Output resolution
+        metadata: Optional image metadata
+        digest: Optional digest of the chart's inputs, recorded once saved
+    """
+    # SECURITY: The payload is always pickled by the parent process, never read
+    # from disk or received from elsewhere
+    fig = pickle.loads(payload)
+    _write_chart(fig, output_path, dpi, metadata, digest)
 
 
 @dataclass
@@ -49,32 +180,44 @@ class ChartGenerator:
         """
         self.config = config
         self.chart_settings = config.chart_settings if config else ChartSettings()
+        # Output directories already created by save_chart, to skip repeat mkdirs
+        self._created_dirs: Set[Path] = set()
+        # Figure and primary axes reused by every create_chart call
+        self._fig: Optional[Figure] = None
+        self._ax1: Optional[Axes] = None
+        # Background savers, created on the first save when save_workers > 1
+        self._save_pool: Optional[ProcessPoolExecutor] = None
+        self._pending_saves: List[Tuple[Future[None], str]] = []
+        # Queued saves already waited for that failed, reported by finish_saves
+        self._failed_saves = 0
         self._setup_style()
 
     def _setup_style(self) -> None:
         """Configure plot styling based on config."""
-        sns.set_style(
-            "whitegrid",
-            {
-                "grid.linestyle": ":",
-                "grid.alpha": 0.2,
-                "axes.edgecolor": "#333333",
-                "axes.linewidth": 1.2,
-                "grid.color": "#CCCCCC",
-            },
-        )
-
-        plt.rcParams.update(
-            {
-                "font.family": "sans-serif",
-                "font.sans-serif": [self.chart_settings.font_family],
-                "font.size": self.chart_settings.font_size,
-                "figure.figsize": self.chart_settings.figure_size,
-                "figure.dpi": self.chart_settings.dpi,
-                "savefig.bbox": "tight",
-                "savefig.pad_inches": 0.2,
-            }
-        )
+        global _applied_rc_settings
+        rc_settings: dict[RcKeyType, Any] = {
+            **BASE_STYLE,
+            "font.family": "sans-serif",
+            "font.sans-serif": [self.chart_settings.font_family],
+            "font.size": self.chart_settings.font_size,
+            "figure.figsize": self.chart_settings.figure_size,
+            # Optimization: Figures are only ever rendered by savefig, which
+            # switches to the output resolution itself; text extents measured
+            # while building a chart don't need the 300 dpi print resolution
+            "figure.dpi": 100,
+            "savefig.dpi": self.chart_settings.dpi,
+            # Optimization: Let Agg merge line vertices closer than a pixel and
+            # draw long lines in chunks; marker-only series are unaffected
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+        }
+        # Optimization: Generators built from the same settings (e.g. one per
+        # worker or per run) skip re-validating and re-applying the rcParams
+        if rc_settings == _applied_rc_settings:
+            return
+        mpl.rcParams.update(rc_settings)
+        _applied_rc_settings = rc_settings
 
     def _update_counts(
         self, data: pd.DataFrame, sensor: str, metrics: ChartMetrics
@@ -128,7 +271,7 @@ class ChartGenerator:
         self._update_sensor_metrics(data, sensor, metrics)
         self._update_hydro_metrics(data, metrics)
 
-    def _configure_primary_axis(self, ax1: plt.Axes) -> None:
+    def _configure_primary_axis(self, ax1: Axes) -> None:
         """Configure labels, colors, ticks, and formatters for the primary axis."""
         ax1.set_xlabel("Time (Minutes)", fontsize=12, labelpad=10)
         ax1.set_ylabel(
@@ -139,6 +282,57 @@ class ChartGenerator:
         ax1.yaxis.set_major_formatter(ticker.StrMethodFormatter("{x:.2f}"))
         ax1.xaxis.set_major_formatter(ticker.StrMethodFormatter("{x:,.0f}"))
 
+    @staticmethod
+    def _new_figure(figsize: Tuple[float, float]) -> Figure:
+        """
+        Create a white, constrained-layout figure with an Agg canvas.
+
+        Optimization: Figures from ``plt.subplots`` stay registered with pyplot
+        until closed explicitly, so a batch run that misses a ``plt.close``
+        accumulates them. These figures are freed like any other object once
+        the last reference to them goes away. Constrained layout fits titles
+        and legends while drawing, so ``savefig`` needs no ``bbox_inches="tight"``
+        pass, which renders the figure twice to measure it.
+        """
+        fig = Figure(figsize=figsize, layout="constrained")
+        FigureCanvasAgg(fig)
+        fig.patch.set_facecolor("white")
+        return fig
+
+    def _get_figure(self) -> Tuple[Figure, Axes]:
+        """
+        Return the reusable figure and primary axes, cleared for a new chart.
+
+        Optimization: Building a figure (canvas, axes, tick locators, font
+        lookups) costs more than drawing a chart's points, so one figure is
+        created lazily and only its contents are reset between charts.
+        """
+        if self._fig is None or self._ax1 is None:
+            self._fig = self._new_figure(self.chart_settings.figure_size)
+            self._ax1 = self._fig.add_subplot()
+            return self._fig, self._ax1
+
+        # Drop the previous chart's secondary (hydrograph) axes, then its artists
+        for ax in self._fig.axes:
+            if ax is not self._ax1:
+                ax.remove()
+        self._ax1.clear()
+        # twinx() moved the primary y ticks to the left side; restore the style's
+        self._ax1.tick_params(
+            axis="y",
+            left=mpl.rcParams["ytick.left"],
+            right=mpl.rcParams["ytick.right"],
+            labelleft=mpl.rcParams["ytick.labelleft"],
+            labelright=mpl.rcParams["ytick.labelright"],
+        )
+        # Constrained layout refines the axes' current position; start it from
+        # the subplot's default position, not the previous chart's layout
+        subplotspec = self._ax1.get_subplotspec()
+        if subplotspec is not None:
+            self._ax1.set_position(subplotspec.get_position(self._fig))
+            self._ax1.set_in_layout(True)  # set_position opts the axes out
+        return self._fig, self._ax1
+
     def create_chart(
         self, data: pd.DataFrame, river_mile: float, year: int, sensor: str
     ) -> Tuple[Optional[Figure], ChartMetrics]:
@@ -152,26 +346,34 @@ class ChartGenerator:
             sensor: Sensor name
 
         Returns:
-            Tuple containing Figure object and ChartMetrics
+            Tuple containing Figure object and ChartMetrics. The figure is reused
+            by the next call, so save it before creating another chart.
         """
         metrics = ChartMetrics()
 
         try:
             logger.debug(
-                f"Creating chart for RM {river_mile}, Year {year}, Sensor {sensor}"
+                "Creating chart for RM %s, Year %s, Sensor %s", river_mile, year, sensor
             )
-            logger.debug(f"Data shape: {data.shape}")
+            logger.debug("Data shape: %s", data.shape)
 
             # Calculate metrics using helper method
             self._calculate_metrics(data, sensor, metrics)
+            # Shared by the legend label and the title
+            sensor_num = sensor_number(sensor)
 
-            # Create figure
-            fig, ax1 = plt.subplots(figsize=self.chart_settings.figure_size)
-            fig.patch.set_facecolor("white")
+            fig, ax1 = self._get_figure()
 
             # Plot Seatek data if present
             if sensor in data.columns and metrics.sensor_count > 0:
-                self._add_sensor_data(ax1, data, sensor)
+                self._add_sensor_data(
+                    ax1,
+                    data,
+                    sensor,
+                    sensor_num,
+                    self.chart_settings.rasterize_markers,
+                    self.chart_settings.max_points,
+                )
 
             # Configure primary axis
             self._configure_primary_axis(ax1)
@@ -179,7 +381,12 @@ class ChartGenerator:
             # Add hydrograph if available
             ax2 = None
             if "Hydrograph (Lagged)" in data.columns and metrics.hydro_count > 0:
-                ax2 = self._add_hydrograph(ax1, data)
+                ax2 = self._add_hydrograph(
+                    ax1,
+                    data,
+                    self.chart_settings.rasterize_markers,
+                    self.chart_settings.max_points,
+                )
 
             # Collect legend handles and labels
             lines, labels = ax1.get_legend_handles_labels()
@@ -201,23 +408,121 @@ class ChartGenerator:
                 )
 
             # Set title and format plot
-            sensor_num = sensor.split("_")[1] if "_" in sensor else sensor
             title_text = f"River Mile {river_mile:.1f} - Year {year}\nSeatek Sensor {sensor_num} Data"
             if ax2 is not None:
                 title_text += " with Hydrograph"
 
-            plt.title(title_text, pad=20, fontsize=14)
-
-            plt.tight_layout()
+            ax1.set_title(title_text, pad=20, fontsize=14)
             return fig, metrics
 
         except Exception as e:
-            logger.error(f"Error creating chart: {str(e)}")
-            plt.close("all")  # Close any open figures on error
+            logger.error("Error creating chart: %s", e)
+            # The cached figure may be half drawn; build a fresh one next time
+            self._fig = None
+            self._ax1 = None
             return None, metrics
 
+    def grid_dpi(self, fig: Figure) -> int:
+        """
+        Return the dpi to save a chart grid at.
+
+        The configured dpi is lowered just enough to keep the saved image
+        within ``GRID_MAX_PIXELS``; the layout in inches is unchanged.
+
+        Args:
+            fig: Figure returned by ``create_chart_grid``
+
+        Returns:
+            Output resolution for the grid
+        """
+        width, height = fig.get_size_inches()
+        max_dpi = math.floor(math.sqrt(GRID_MAX_PIXELS / (width * height)))
+        return max(1, min(self.chart_settings.dpi, max_dpi))
+
+    def create_chart_grid(
+        self, entries: Sequence[Tuple[int, str, pd.DataFrame]], river_mile: float
+    ) -> Optional[Figure]:
+        """
+        Create one figure with a panel per (year, sensor) chart of a river mile.
+
+        Panels are drawn with the same helpers as ``create_chart``, so a whole
+        river mile costs one figure, one legend and one ``savefig`` instead of
+        one of each per chart.
+
+        Args:
+            entries: ``(year, sensor, data)`` tuples, one per panel, in display order
+            river_mile: River mile the entries belong to
+
+        Returns:
+            Figure object, or None if there is nothing to plot or drawing fails
+        """
+        if not entries:
+            return None
+
+        try:
+            n_panels = len(entries)
+            ncols = math.ceil(math.sqrt(n_panels))
+            nrows = math.ceil(n_panels / ncols)
+            panel_width, panel_height = GRID_PANEL_SIZE
+            fig = self._new_figure((panel_width * ncols, panel_height * nrows))
+            axes = fig.subplots(nrows, ncols, squeeze=False)
+            rasterized = self.chart_settings.rasterize_markers
+            max_points = self.chart_settings.max_points
+
+            # Legend entries keyed by label, so each series appears once
+            legend_handles: dict[str, Any] = {}
+            for ax1, (year, sensor, data) in zip(axes.flat, entries):
+                metrics = ChartMetrics()
+                self._update_counts(data, sensor, metrics)
+                sensor_num = sensor_number(sensor)
+
+                if sensor in data.columns and metrics.sensor_count > 0:
+                    self._add_sensor_data(
+                        ax1, data, sensor, sensor_num, rasterized, max_points
+                    )
+                self._configure_primary_axis(ax1)
+
+                ax2 = None
+                if HYDROGRAPH_COL in data.columns and metrics.hydro_count > 0:
+                    ax2 = self._add_hydrograph(ax1, data, rasterized, max_points)
+
+                for ax in (ax1, ax2):
+                    if ax is not None:
+                        handles, labels = ax.get_legend_handles_labels()
+                        legend_handles.update(zip(labels, handles))
+
+                ax1.set_title(f"Year {year} - Sensor {sensor_num}", fontsize=12)
+
+            # Hide the unused cells of the last row
+            for ax in axes.flat[n_panels:]:
+                ax.set_visible(False)
+
+            fig.suptitle(f"River Mile {river_mile:.1f}", fontsize=14)
+            if legend_handles:
+                fig.legend(
+                    list(legend_handles.values()),
+                    list(legend_handles.keys()),
+                    loc="outside lower center",
+                    framealpha=1.0,
+                    edgecolor="#333333",
+                    ncol=min(len(legend_handles), 4),
+                    fontsize=11,
+                )
+            return fig
+
+        except Exception as e:
+            logger.error("Error creating chart grid: %s", e)
+            return None
+
     @staticmethod
-    def _add_sensor_data(ax1: plt.Axes, data: pd.DataFrame, sensor: str) -> None:
+    def _add_sensor_data(
+        ax1: Axes,
+        data: pd.DataFrame,
+        sensor: str,
+        sensor_num: str,
+        rasterized: bool = True,
+        max_points: Optional[int] = None,
+    ) -> None:
         """
         Add sensor data to the plot.
 
@@ -225,113 +530,290 @@ class ChartGenerator:
             ax1: Primary axes object
             data: DataFrame containing sensor data
             sensor: Name of the sensor column
+            sensor_num: Sensor number shown in the legend label
+            rasterized: Whether to rasterize the markers in vector output
+            max_points: Optional marker budget; denser series keep their extremes
         """
-        # ⚡ Bolt Optimization: Avoid intermediate DataFrame allocation by omitting .dropna()
-        # Matplotlib's scatter natively handles NaN values. Use np.all(pd.isna(...)) to avoid Series overhead.
-        if not np.all(pd.isna(data[sensor].values)):
-            ax1.scatter(
-                data["Time (Minutes)"],
-                data[sensor],
+        # Optimization: Mask the NaN readings once on the two NumPy arrays that are
+        # plotted, instead of filtering the DataFrame or passing Series through.
+        times = data["Time (Minutes)"].to_numpy(dtype=np.float64)
+        readings = data[sensor].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(readings)
+        if valid.any():
+            # Optimization: Every marker shares one style, so draw them as a single
+            # marker-only Line2D rather than a scatter PathCollection, which
+            # carries and transforms per-point sizes and colors.
+            ax1.plot(
+                *_downsample_extremes(times[valid], readings[valid], max_points),
+                linestyle="None",
+                marker="o",
                 color=SEATEK_COLOR,
                 alpha=1.0,
-                s=45,
-                edgecolors=MARKER_EDGE_COLOR,
-                linewidth=MARKER_EDGE_LINEWIDTH,
-                label=f'Sensor {sensor.split("_")[1] if "_" in sensor else sensor} (NAVD88)',
+                markersize=SENSOR_MARKER_SIZE,
+                markeredgecolor=MARKER_EDGE_COLOR,
+                markeredgewidth=MARKER_EDGE_LINEWIDTH,
+                rasterized=rasterized,
+                label=f"Sensor {sensor_num} (NAVD88)",
             )
 
     @staticmethod
-    def _format_hydrograph_axis(ax: plt.Axes, hydro_values: pd.Series) -> None:
-        """Format the hydrograph y-axis based on values."""
+    def _format_hydrograph_axis(
+        ax: Axes, hydro_values: npt.NDArray[np.float64]
+    ) -> None:
+        """Format the hydrograph y-axis based on its non-NaN values."""
         # Compute maximum deviation from nearest integer to detect fractional values
-        # ⚡ Bolt Optimization: Use guard conditions before NumPy nanmax to prevent warnings, and replace Pandas intermediate object allocations
-        hydro_values_arr = hydro_values.to_numpy(dtype=np.float64)
-        if len(hydro_values_arr) > 0 and not np.all(np.isnan(hydro_values_arr)):
+        # ⚡ Bolt Optimization: Guard against empty input before NumPy max to prevent warnings
+        if len(hydro_values) > 0:
             max_frac_deviation = float(
-                np.nanmax(np.abs(hydro_values_arr - np.round(hydro_values_arr)))
+                np.max(np.abs(hydro_values - np.round(hydro_values)))
             )
         else:
             max_frac_deviation = float("nan")
 
-        if not pd.isna(max_frac_deviation) and max_frac_deviation < 1e-6:
+        if not np.isnan(max_frac_deviation) and max_frac_deviation < 1e-6:
             hydro_fmt = "{x:,.0f}"
         else:
             hydro_fmt = "{x:,.2f}"
         ax.yaxis.set_major_formatter(ticker.StrMethodFormatter(hydro_fmt))
 
     @staticmethod
-    def _add_hydrograph(ax1: plt.Axes, data: pd.DataFrame) -> Optional[plt.Axes]:
+    def _add_hydrograph(
+        ax1: Axes,
+        data: pd.DataFrame,
+        rasterized: bool = True,
+        max_points: Optional[int] = None,
+    ) -> Optional[Axes]:
         """
         Add hydrograph data to the plot.
 
         Args:
             ax1: Primary axes object
             data: DataFrame containing hydrograph data
+            rasterized: Whether to rasterize the markers in vector output
+            max_points: Optional marker budget; denser series keep their extremes
 
         Returns:
             Secondary axes object if successful, None otherwise
         """
         try:
             ax2 = ax1.twinx()
-            # ⚡ Bolt Optimization: Avoid intermediate DataFrame allocation by omitting .dropna()
-            # Matplotlib's scatter natively handles NaN values. Use np.all(pd.isna(...)) to avoid Series overhead.
-            if not np.all(pd.isna(data["Hydrograph (Lagged)"].values)):
-                ax2.scatter(
-                    data["Time (Minutes)"],
-                    data["Hydrograph (Lagged)"],
+            # Optimization: Mask the NaN readings once on the plotted NumPy arrays;
+            # the axis formatter below reuses the masked values.
+            times = data["Time (Minutes)"].to_numpy(dtype=np.float64)
+            hydro_values = data[HYDROGRAPH_COL].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(hydro_values)
+            if valid.any():
+                hydro_values = hydro_values[valid]
+                # Uniformly styled markers: one Line2D, as in _add_sensor_data
+                ax2.plot(
+                    *_downsample_extremes(times[valid], hydro_values, max_points),
+                    linestyle="None",
+                    marker="s",
                     color=HYDRO_COLOR,
                     alpha=1.0,
-                    s=70,
-                    marker="s",
-                    edgecolors=MARKER_EDGE_COLOR,
-                    linewidth=MARKER_EDGE_LINEWIDTH,
+                    markersize=HYDRO_MARKER_SIZE,
+                    markeredgecolor=MARKER_EDGE_COLOR,
+                    markeredgewidth=MARKER_EDGE_LINEWIDTH,
+                    rasterized=rasterized,
                     label="Hydrograph (GPM)",
                 )
                 ax2.set_ylabel("Hydrograph (GPM)", color=HYDRO_COLOR, fontsize=12)
                 ax2.tick_params(axis="y", labelcolor=HYDRO_COLOR)
 
-                # Choose y-axis formatter based on whether hydrograph values are effectively integers
-                # ⚡ Bolt Optimization: Avoid intermediate DataFrame allocation by omitting .dropna()
-                ChartGenerator._format_hydrograph_axis(ax2, data["Hydrograph (Lagged)"])
+                # Choose y-axis formatter based on whether hydrograph values are
+                # effectively integers, judged on every value, not just those plotted
+                ChartGenerator._format_hydrograph_axis(ax2, hydro_values)
 
             return ax2
         except Exception as e:
-            logger.error(f"Error adding hydrograph: {str(e)}")
+            logger.error("Error adding hydrograph: %s", e)
             return None
 
+    def chart_digest(
+        self, data: pd.DataFrame, river_mile: float, year: int, sensor: str
+    ) -> str:
+        """
+        Return a digest of everything ``create_chart`` draws for these arguments.
+
+        The digest covers the plotted columns (values and dtypes), the title
+        fields, the chart settings that affect rendering, and the package and
+        matplotlib versions, so an unchanged digest means an unchanged image.
+
+        Args:
+            data: DataFrame containing processed data
+            river_mile: River mile for the data
+            year: Year for the data
+            sensor: Sensor name
+
+        Returns:
+            Hex digest of the chart's inputs
+        """
+        settings = self.chart_settings
+        # BLAKE2 hashes the raw column bytes faster than SHA-2
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(
+            repr(
+                (
+                    __version__,
+                    mpl.__version__,
+                    river_mile,
+                    year,
+                    sensor,
+                    settings.dpi,
+                    tuple(settings.figure_size),
+                    settings.font_family,
+                    settings.font_size,
+                    settings.rasterize_markers,
+                    settings.max_points,
+                )
+            ).encode("utf-8")
+        )
+        for col in ("Time (Minutes)", sensor, HYDROGRAPH_COL):
+            if col in data.columns:
+                values = np.ascontiguousarray(data[col].to_numpy())
+                hasher.update(f"{col}:{values.dtype.str}:{len(values)}".encode("utf-8"))
+                hasher.update(values.tobytes())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def is_chart_current(output_path: Path, digest: str) -> bool:
+        """
+        Check whether ``output_path`` was saved from inputs with ``digest``.
+
+        Args:
+            output_path: Path the chart is saved to
+            digest: Digest from ``chart_digest`` for the chart about to be drawn
+
+        Returns:
+            True if the chart exists and was saved with ``save_chart(..., digest=digest)``
+        """
+        try:
+            return (
+                output_path.is_file()
+                and _digest_path(output_path).read_text() == digest
+            )
+        except OSError:
+            return False
+
     def save_chart(
         self,
         fig: Figure,
         output_path: str,
         dpi: Optional[int] = None,
         metadata: Optional[dict[str, str]] = None,
+        digest: Optional[str] = None,
     ) -> bool:
         """
         Save chart to file.
 
+        With ``save_workers`` > 1 the figure is pickled and encoded by a
+        background process, and this only reports whether the save was queued;
+        call ``finish_saves`` to wait for queued saves and collect failures.
+
         Args:
             fig: Figure to save
             output_path: Path to save the figure to
             dpi: Optional DPI override
             metadata: Optional dictionary with image metadata (e.g. Title, Description for a11y)
+            digest: Optional ``chart_digest`` of the chart, recorded next to the
+                image once it is saved so ``is_chart_current`` can skip redrawing it
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Create parent directories if they don't exist
+            # Create parent directories if they don't exist. Charts are saved in
+            # batches per river mile, so only the first save into a directory
+            # needs the mkdir syscall.
             path_obj = Path(output_path)
-            path_obj.parent.mkdir(parents=True, exist_ok=True)
-
-            fig.savefig(
-                path_obj,
-                dpi=dpi or self.chart_settings.dpi,
-                bbox_inches="tight",
-                metadata=metadata,
+            if path_obj.parent not in self._created_dirs:
+                path_obj.parent.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(path_obj.parent)
+
+            if self.chart_settings.save_workers > 1:
+                # Optimization: Encoding the PNG is a large share of each chart's
+                # cost. A snapshot of the figure is encoded in another process
+                # while this one draws the next chart into the reused figure.
+                if self._save_pool is None:
+                    self._save_pool = ProcessPoolExecutor(
+                        max_workers=self.chart_settings.save_workers
+                    )
+                future = self._save_pool.submit(
+                    _save_pickled_figure,
+                    pickle.dumps(fig),
+                    path_obj,
+                    dpi or self.chart_settings.dpi,
+                    metadata,
+                    digest,
+                )
+                self._pending_saves.append((future, output_path))
+                # Backpressure: each queued save holds a pickled figure, so
+                # drawing may run at most two saves per worker ahead of them
+                while len(self._pending_saves) > 2 * self.chart_settings.save_workers:
+                    if not self._collect_save(*self._pending_saves.pop(0)):
+                        self._failed_saves += 1
+                return True
+
+            _write_chart(
+                fig, path_obj, dpi or self.chart_settings.dpi, metadata, digest
             )
-            plt.close(fig)  # Free memory
-            logger.info(f"Saved chart to {output_path}")
+            logger.info("Saved chart to %s", output_path)
             return True
         except Exception as e:
-            logger.error(f"Error saving chart: {str(e)}")
+            logger.error("Error saving chart: %s", e)
             return False
+
+    @staticmethod
+    def _collect_save(future: Future[None], output_path: str) -> bool:
+        """
+        Wait for one queued save and log its outcome.
+
+        Args:
+            future: Future of the background save
+            output_path: Path the chart is saved to
+
+        Returns:
+            True if the chart was saved, False otherwise
+        """
+        try:
+            future.result()
+            logger.info("Saved chart to %s", output_path)
+            return True
+        except Exception as e:
+            logger.error("Error saving chart %s: %s", output_path, e)
+            return False
+
+    def finish_saves(self) -> int:
+        """
+        Wait for charts queued by ``save_chart`` and stop the background savers.
+
+        Returns:
+            Number of queued charts that failed to save, including those
+            already waited for while the batch was being drawn
+        """
+        failures = self._failed_saves
+        for future, output_path in self._pending_saves:
+            if not self._collect_save(future, output_path):
+                failures += 1
+        self._pending_saves.clear()
+        self._failed_saves = 0
+
+        if self._save_pool is not None:
+            self._save_pool.shutdown()
+            self._save_pool = None
+        return failures
+
+    def close(self) -> None:
+        """
+        Release the reusable figure and background savers at the end of a batch.
+
+        Charts still queued by ``save_chart`` are waited for first, so an
+        interrupted batch never leaves saver processes behind. The generator
+        stays usable: the next ``create_chart`` call builds a fresh figure.
+        """
+        if self._pending_saves or self._save_pool is not None:
+            self.finish_saves()
+        if self._fig is not None:
+            self._fig.clear()
+        self._fig = None
+        self._ax1 = None
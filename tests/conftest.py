@@ -0,0 +1,60 @@
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+from typing import Any, Dict, Union
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from src.hydrograph_seatek_analysis.utils.cache import DataFrameCache
+
+
+class FakeWorkbook:
+    """Serve DataFrames to patched ``pandas`` Excel readers, keyed by sheet name.
+
+    A sheet may also map to an exception, which is raised when it is read.
+    """
+
+    def __init__(self) -> None:
+        self.sheets: Dict[Any, Union[pd.DataFrame, Exception]] = {}
+        self.read_excel = mock.Mock(side_effect=self._read_excel)
+        # Usable both directly and as a context manager, like pd.ExcelFile
+        self.excel_file = mock.MagicMock()
+        self.excel_file.__enter__.return_value = self.excel_file
+
+    def _read_excel(self, *args: Any, **kwargs: Any) -> pd.DataFrame:
+        df = self.sheets.get(kwargs.get("sheet_name"), pd.DataFrame())
+        if isinstance(df, Exception):
+            raise df
+        usecols = kwargs.get("usecols")
+        if callable(usecols):
+            # Mirror pandas: offer every header to the filter, keep the accepted ones
+            return df[[col for col in df.columns if usecols(col)]]
+        return df
+
+
+@pytest.fixture
+def mock_file_checks():
+    """Make every data file look like a small regular file on disk."""
+    with (
+        mock.patch.object(Path, "is_symlink", return_value=False),
+        mock.patch.object(Path, "is_file", return_value=True),
+        mock.patch.object(Path, "stat", return_value=mock.Mock(st_size=1000)),
+    ):
+        yield
+
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    """Disable the on-disk DataFrame cache so loaders always parse the workbook."""
+    monkeypatch.setattr(DataFrameCache, "enabled", property(lambda self: False))
+
+
+@pytest.fixture
+def workbook(monkeypatch):
+    """Patch pandas Excel readers to serve sheets from a FakeWorkbook."""
+    fake = FakeWorkbook()
+    monkeypatch.setattr(pd, "read_excel", fake.read_excel)
+    monkeypatch.setattr(pd, "ExcelFile", mock.Mock(return_value=fake.excel_file))
+    return fake
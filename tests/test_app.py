@@ -74,6 +74,7 @@ class TestApplication(unittest.TestCase):
         self._setup_mock_processor(app)
         app.processor.process_data.return_value = ([1], {})
         app.chart_generator = mock_chart_gen_class.return_value
+        app.chart_generator.finish_saves.return_value = 0
         return app, app.chart_generator
 
     def test_process_data_no_processor(self) -> None:
@@ -94,6 +95,57 @@ class TestApplication(unittest.TestCase):
         ) as mock_save:
             self.assertTrue(app.process_data())
             mock_save.assert_called_once()
+        chart_gen.close.assert_called_once_with()
+
+    @mock.patch("src.hydrograph_seatek_analysis.app.ChartGenerator")
+    def test_process_data_grid(self, mock_chart_gen_class: mock.MagicMock) -> None:
+        """Test that grid mode saves one chart grid per river mile."""
+        app, chart_gen = self._setup_processing_test(mock_chart_gen_class)
+        self.temp_config.chart_settings.grid_per_river_mile = True
+        chart_gen.save_chart.return_value = True
+
+        self.assertTrue(app.process_data())
+
+        chart_gen.create_chart.assert_not_called()
+        chart_gen.create_chart_grid.assert_called_once_with(
+            [(2020, "sensor_1", [1])], 12.3
+        )
+        output_path = chart_gen.save_chart.call_args.args[1]
+        self.assertTrue(output_path.endswith("RM_12.3_grid.png"))
+        self.assertEqual(
+            chart_gen.save_chart.call_args.kwargs["dpi"],
+            chart_gen.grid_dpi.return_value,
+        )
+
+    @mock.patch("src.hydrograph_seatek_analysis.app.ChartGenerator")
+    def test_process_data_background_save_failure(
+        self, mock_chart_gen_class: mock.MagicMock
+    ) -> None:
+        """Test that charts failing to save in the background count as errors."""
+        app, chart_gen = self._setup_processing_test(mock_chart_gen_class)
+        chart_gen.create_chart.return_value = (mock.MagicMock(), {})
+        chart_gen.finish_saves.return_value = 1
+
+        with mock.patch.object(app, "_save_generated_chart", return_value=True):
+            self.assertFalse(app.process_data())
+        chart_gen.finish_saves.assert_called_once_with()
+
+    @mock.patch("src.hydrograph_seatek_analysis.app.ChartGenerator")
+    def test_process_data_skips_unchanged_chart(
+        self, mock_chart_gen_class: mock.MagicMock
+    ) -> None:
+        """Test that charts with an up-to-date saved image are not redrawn."""
+        app, chart_gen = self._setup_processing_test(mock_chart_gen_class)
+        self.temp_config.chart_settings.skip_unchanged = True
+        chart_gen.chart_digest.return_value = "abc123"
+        chart_gen.is_chart_current.return_value = True
+
+        self.assertTrue(app.process_data())
+
+        chart_gen.create_chart.assert_not_called()
+        output_path, digest = chart_gen.is_chart_current.call_args.args
+        self.assertEqual(output_path.name, "Year_2020_sensor_1.png")
+        self.assertEqual(digest, "abc123")
 
     def test_process_data_empty_data(self) -> None:
         """Test process_data when processor returns empty data."""
@@ -179,6 +231,24 @@ class TestMain(unittest.TestCase):
         mock_configure_logger.assert_called_once()
         mock_path.return_value.mkdir.assert_called_once_with(exist_ok=True)
 
+    @mock.patch("src.hydrograph_seatek_analysis.app.matplotlib.use")
+    @mock.patch("src.hydrograph_seatek_analysis.app.configure_root_logger")
+    @mock.patch("src.hydrograph_seatek_analysis.app.Application")
+    @mock.patch("src.hydrograph_seatek_analysis.app.Config")
+    @mock.patch("src.hydrograph_seatek_analysis.app.Path")
+    def test_main_uses_agg_backend(
+        self,
+        mock_path,
+        mock_config_class,
+        mock_app_class,
+        mock_configure_logger,
+        mock_use,
+    ) -> None:
+        """Test main selects the non-interactive Agg backend."""
+        main(argv=[])
+
+        mock_use.assert_called_once_with("Agg")
+
     @mock.patch("src.hydrograph_seatek_analysis.app.configure_root_logger")
     @mock.patch("src.hydrograph_seatek_analysis.app.Application")
     @mock.patch("src.hydrograph_seatek_analysis.app.Config")
@@ -211,8 +281,10 @@ class TestMain(unittest.TestCase):
             exit_code = main(argv=[])
 
         self.assertEqual(exit_code, 1)
-        mock_logging_error.assert_called_once_with(
-            "Fatal error in main execution: Test Exception"
+        mock_logging_error.assert_called_once()
+        message, *args = mock_logging_error.call_args.args
+        self.assertEqual(
+            message % tuple(args), "Fatal error in main execution: Test Exception"
         )
 
     @mock.patch("src.hydrograph_seatek_analysis.app.configure_root_logger")
@@ -259,6 +331,25 @@ class TestMain(unittest.TestCase):
         mock_config_class.assert_called_once_with(base_dir=Path("/tmp/test-data"))
         mock_app_class.assert_called_once_with(config=mock_config_instance)
 
+    @mock.patch("src.hydrograph_seatek_analysis.app.configure_root_logger")
+    @mock.patch("src.hydrograph_seatek_analysis.app.Application")
+    @mock.patch("src.hydrograph_seatek_analysis.app.Path")
+    def test_main_workers(
+        self, mock_path, mock_app_class, mock_configure_logger
+    ) -> None:
+        """Test --workers opts in to parallel parsing; 0 uses one per CPU core."""
+        main(argv=[])
+        config = mock_app_class.call_args.kwargs["config"]
+        self.assertEqual(config.max_workers, 1)
+
+        main(argv=["--workers", "4"])
+        config = mock_app_class.call_args.kwargs["config"]
+        self.assertEqual(config.max_workers, 4)
+
+        main(argv=["--workers", "0"])
+        config = mock_app_class.call_args.kwargs["config"]
+        self.assertIsNone(config.max_workers)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,85 @@
+"""Tests for the on-disk DataFrame cache."""
+
+import os
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from src.hydrograph_seatek_analysis.utils import cache as cache_module
+from src.hydrograph_seatek_analysis.utils.cache import DataFrameCache
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Create a stand-in workbook file."""
+    path = tmp_path / "RM_54.0.xlsx"
+    path.write_bytes(b"workbook")
+    return path
+
+
+def test_cache_disabled_without_directory(tmp_path, source, monkeypatch):
+    """Test that the cache is a no-op until its directory exists."""
+    monkeypatch.setattr(cache_module, "HAS_PARQUET", True)
+    cache = DataFrameCache(tmp_path / "missing")
+
+    assert not cache.enabled
+    cache.store(source, pd.DataFrame({"Year": [1]}))
+    assert cache.load(source) is None
+    assert not (tmp_path / "missing").exists()
+
+
+def test_cache_disabled_without_pyarrow(tmp_path, source, monkeypatch):
+    """Test that the cache is a no-op when pyarrow is not installed."""
+    monkeypatch.setattr(cache_module, "HAS_PARQUET", False)
+    cache = DataFrameCache(tmp_path)
+
+    assert not cache.enabled
+    cache.store(source, pd.DataFrame({"Year": [1]}))
+    assert cache.load(source) is None
+    assert list(tmp_path.glob("*.parquet")) == []
+
+
+def test_cache_entry_tracks_source_changes(tmp_path, source):
+    """Test that entries are keyed by file contents metadata and caller key."""
+    cache = DataFrameCache(tmp_path)
+    original = cache._entry_path(source, "RM_54.0")
+
+    assert cache._entry_path(source, "RM_54.0") == original
+    assert cache._entry_path(source, "RM_53.0") != original
+
+    source.write_bytes(b"edited workbook")
+    os.utime(source, ns=(0, 0))
+    assert cache._entry_path(source, "RM_54.0") != original
+
+
+def test_cache_entry_tracks_cache_version(tmp_path, source, monkeypatch):
+    """Test that bumping CACHE_VERSION invalidates existing entries."""
+    cache = DataFrameCache(tmp_path)
+    original = cache._entry_path(source, "RM_54.0")
+
+    monkeypatch.setattr(cache_module, "CACHE_VERSION", cache_module.CACHE_VERSION + 1)
+    assert cache._entry_path(source, "RM_54.0") != original
+
+
+def test_cache_round_trip(tmp_path, source):
+    """Test that a stored DataFrame is returned unchanged on the next load."""
+    pytest.importorskip("pyarrow")
+    cache = DataFrameCache(tmp_path)
+    df = pd.DataFrame(
+        {"Time (Seconds)": [0, 60], "Year": [1, 1], "Sensor_1": [1.0, 2.0]}
+    )
+
+    assert cache.load(source) is None
+    cache.store(source, df)
+    assert_frame_equal(cache.load(source), df)
+
+
+@pytest.mark.usefixtures("mock_file_checks")
+def test_cache_misses_when_stat_is_unusable(tmp_path, source, monkeypatch):
+    """Test that a failing stat call is a cache miss rather than an error."""
+    monkeypatch.setattr(cache_module, "HAS_PARQUET", True)
+    cache = DataFrameCache(tmp_path)
+
+    assert cache.load(source) is None
+    cache.store(source, pd.DataFrame({"Year": [1]}))
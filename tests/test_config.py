@@ -34,6 +34,20 @@ def test_config_custom_base_dir():
         assert config.output_dir == temp_path / "output/charts"
 
 
+def test_config_defers_directory_creation(tmp_path):
+    """Test that Config has no filesystem side effects until ensure_directories."""
+    config = Config(base_dir=tmp_path)
+
+    assert not config.data_dir.exists()
+    assert not config.output_dir.exists()
+
+    config.ensure_directories()
+
+    assert config.raw_data_dir.is_dir()
+    assert config.processed_dir.is_dir()
+    assert config.output_dir.is_dir()
+
+
 def test_navd_constants():
     """Test that NavdConstants can be initialized with default and custom values."""
     # Default values
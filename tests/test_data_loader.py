@@ -1,14 +1,18 @@
 """Tests for the data loader module."""
 
-import tempfile
 from pathlib import Path
 from unittest import mock
 
 import pandas as pd
 import pytest
+from pandas.testing import assert_frame_equal
 
 from src.hydrograph_seatek_analysis.core.config import Config
-from src.hydrograph_seatek_analysis.data.data_loader import DataLoader
+from src.hydrograph_seatek_analysis.data.data_loader import (
+    SHEET_INDEX_KEY,
+    DataLoader,
+)
+from src.hydrograph_seatek_analysis.utils.excel import EXCEL_ENGINE
 
 
 def test_data_loader_initialization():
@@ -39,72 +43,47 @@ def test_validate_columns_failure():
     assert "Year" in str(exc_info.value)
 
 
-def test_get_available_river_miles():
+def test_get_available_river_miles(tmp_path):
     """Test get_available_river_miles function."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
+    # Create mock river mile files
+    (tmp_path / "RM_54.0.xlsx").touch()
+    (tmp_path / "RM_53.0.xlsx").touch()
+    (tmp_path / "OtherFile.xlsx").touch()  # Should be ignored
 
-        # Create mock river mile files
-        (temp_path / "RM_54.0.xlsx").touch()
-        (temp_path / "RM_53.0.xlsx").touch()
-        (temp_path / "OtherFile.xlsx").touch()  # Should be ignored
+    result = DataLoader.get_available_river_miles(tmp_path)
+    assert result == [53.0, 54.0]  # Should be sorted
 
-        result = DataLoader.get_available_river_miles(temp_path)
-        assert result == [53.0, 54.0]  # Should be sorted
 
-
-def test_get_available_river_miles_empty():
+def test_get_available_river_miles_empty(tmp_path):
     """Test get_available_river_miles with no files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        result = DataLoader.get_available_river_miles(temp_path)
-        assert result == []
+    result = DataLoader.get_available_river_miles(tmp_path)
+    assert result == []
 
 
-@mock.patch.object(Path, "is_symlink", return_value=False)
-@mock.patch("pandas.read_excel")
-def test_load_summary_data(mock_read_excel, mock_is_symlink):
+@pytest.mark.usefixtures("mock_file_checks", "no_cache")
+def test_load_summary_data(workbook):
     """Test _load_summary_data with mocked Excel file."""
     mock_df = pd.DataFrame(
         {"River_Mile": [54.0, 53.0], "Y_Offset": [10.5, 11.2], "Num_Sensors": [2, 2]}
     )
-
-    def mock_read_excel_func(*args, **kwargs):
-        usecols = kwargs.get("usecols")
-        if callable(usecols):
-            selected_cols = [col for col in mock_df.columns if usecols(col)]
-            return mock_df[selected_cols]
-        return mock_df
-
-    mock_read_excel.side_effect = mock_read_excel_func
+    workbook.sheets[None] = mock_df
 
     config = Config()
-    data_loader = DataLoader(config)
+    result = DataLoader(config)._load_summary_data()
 
-    # Mock exists check to avoid file not found error
-    with mock.patch.object(Path, "is_file", return_value=True):
-        with mock.patch.object(Path, "stat") as mock_stat:
-            mock_stat.return_value.st_size = 1000
-            result = data_loader._load_summary_data()
-
-    assert result.equals(mock_df)
-    mock_read_excel.assert_called_once()
-    args, kwargs = mock_read_excel.call_args
+    assert_frame_equal(result, mock_df)
+    workbook.read_excel.assert_called_once()
+    args, kwargs = workbook.read_excel.call_args
     assert args[0] == config.summary_file
+    assert kwargs["engine"] == EXCEL_ENGINE
     assert callable(kwargs.get("usecols"))
 
 
-@mock.patch("pandas.ExcelFile")
-@mock.patch.object(Path, "is_symlink", return_value=False)
-@mock.patch("pandas.read_excel")
-def test_load_hydro_data_skips_invalid_sheet_value_error(
-    mock_read_excel, mock_is_symlink, mock_excel_file_cls, caplog
-):
+@pytest.mark.usefixtures("mock_file_checks", "no_cache")
+def test_load_hydro_data_skips_invalid_sheet_value_error(workbook, caplog):
     """Test _load_hydro_data skips sheets that raise a parsing ValueError."""
-    mock_excel_file = mock.MagicMock()
-    mock_excel_file.sheet_names = ["RM_invalid", "RM_54.0"]
-    mock_excel_file_cls.return_value = mock_excel_file
-
+    workbook.excel_file.sheet_names = ["RM_invalid", "RM_54.0"]
+    workbook.sheets["RM_invalid"] = ValueError("No columns to parse from file")
     valid_df = pd.DataFrame(
         {
             "Time (Seconds)": [0, 60, 120],
@@ -113,37 +92,72 @@ def test_load_hydro_data_skips_invalid_sheet_value_error(
             "Hydrograph (Lagged)": [0.1, 0.2, 0.3],
         }
     )
+    workbook.sheets["RM_54.0"] = valid_df
 
-    def mock_read_excel_func(*args, **kwargs):
-        sheet_name = kwargs.get("sheet_name")
-        if sheet_name == "RM_invalid":
-            raise ValueError("No columns to parse from file")
-
-        usecols = kwargs.get("usecols")
-        if callable(usecols):
-            selected_cols = [col for col in valid_df.columns if usecols(col)]
-            return valid_df[selected_cols]
-        return valid_df
-
-    mock_read_excel.side_effect = mock_read_excel_func
-
-    config = Config()
-    data_loader = DataLoader(config)
-
-    with mock.patch.object(Path, "is_file", return_value=True):
-        with mock.patch.object(Path, "stat") as mock_stat:
-            mock_stat.return_value.st_size = 1000
-            result = data_loader._load_hydro_data()
+    result = DataLoader(Config())._load_hydro_data()
 
     expected_df = valid_df[
         ["Time (Seconds)", "Year", "Sensor_1", "Hydrograph (Lagged)"]
     ]
     assert list(result) == ["RM_54.0"]
-    assert result["RM_54.0"].equals(expected_df)
+    assert_frame_equal(result["RM_54.0"], expected_df)
     assert list(result["RM_54.0"].columns) == list(expected_df.columns)
     assert "Skipping sheet RM_invalid: No columns to parse from file" in caplog.text
+    # The workbook handle is closed once every sheet has been read
+    workbook.excel_file.__exit__.assert_called_once()
+
 
+def _fake_cache(entries):
+    """Build a stand-in DataFrameCache serving ``entries`` keyed by cache key."""
+    cache = mock.Mock()
+    cache.load.side_effect = lambda source, key="": entries.get(key)
+    return cache
 
+
+@pytest.mark.usefixtures("mock_file_checks")
+def test_load_hydro_data_fully_cached_skips_workbook(workbook):
+    """Test _load_hydro_data never opens the workbook when every sheet is cached."""
+    df = pd.DataFrame({"Time (Seconds)": [0, 60], "Year": [1, 1]})
+    data_loader = DataLoader(Config())
+    data_loader.cache = _fake_cache(
+        {SHEET_INDEX_KEY: pd.DataFrame({"sheet": ["RM_54.0"]}), "RM_54.0": df}
+    )
+
+    result = data_loader._load_hydro_data()
+
+    assert list(result) == ["RM_54.0"]
+    assert_frame_equal(result["RM_54.0"], df)
+    pd.ExcelFile.assert_not_called()
+    workbook.read_excel.assert_not_called()
+    data_loader.cache.store.assert_not_called()
+
+
+@pytest.mark.usefixtures("mock_file_checks")
+def test_load_hydro_data_parses_only_cache_misses(workbook):
+    """Test _load_hydro_data reads only the sheets missing from the cache."""
+    cached_df = pd.DataFrame({"Time (Seconds)": [0], "Year": [1]})
+    parsed_df = pd.DataFrame({"Time (Seconds)": [60], "Year": [2]})
+    workbook.sheets["RM_53.0"] = parsed_df
+    data_loader = DataLoader(Config())
+    data_loader.cache = _fake_cache(
+        {
+            SHEET_INDEX_KEY: pd.DataFrame({"sheet": ["RM_54.0", "RM_53.0"]}),
+            "RM_54.0": cached_df,
+        }
+    )
+
+    result = data_loader._load_hydro_data()
+
+    assert list(result) == ["RM_54.0", "RM_53.0"]
+    assert_frame_equal(result["RM_54.0"], cached_df)
+    assert_frame_equal(result["RM_53.0"], parsed_df)
+    workbook.read_excel.assert_called_once()
+    assert workbook.read_excel.call_args.kwargs["sheet_name"] == "RM_53.0"
+    data_loader.cache.store.assert_called_once()
+    assert data_loader.cache.store.call_args.kwargs["key"] == "RM_53.0"
+
+
+@pytest.mark.usefixtures("mock_file_checks")
 @mock.patch("pandas.ExcelFile")
 def test_load_hydro_data_exception(mock_excel_file_cls, caplog):
     """Test _load_hydro_data with an exception during ExcelFile initialization.
@@ -154,15 +168,10 @@ def test_load_hydro_data_exception(mock_excel_file_cls, caplog):
     """
     mock_excel_file_cls.side_effect = RuntimeError("Test error")
 
-    config = Config()
-    data_loader = DataLoader(config)
+    data_loader = DataLoader(Config())
 
-    with mock.patch.object(Path, "is_symlink", return_value=False):
-        with mock.patch.object(Path, "is_file", return_value=True):
-            with mock.patch.object(Path, "stat") as mock_stat:
-                mock_stat.return_value.st_size = 1000
-                with pytest.raises(RuntimeError, match="Test error"):
-                    data_loader._load_hydro_data()
+    with pytest.raises(RuntimeError, match="Test error"):
+        data_loader._load_hydro_data()
 
     assert "Error loading hydrograph data: Test error" in caplog.text
 
@@ -182,10 +191,10 @@ def test_load_all_data_success(mock_load_summary, mock_load_hydro):
 
     summary_data, hydro_data = data_loader.load_all_data()
 
-    assert summary_data.equals(mock_summary_df)
+    assert_frame_equal(summary_data, mock_summary_df)
     assert set(hydro_data.keys()) == set(mock_hydro_dict.keys())
     for key in hydro_data:
-        assert hydro_data[key].equals(mock_hydro_dict[key])
+        assert_frame_equal(hydro_data[key], mock_hydro_dict[key])
     mock_load_summary.assert_called_once()
     mock_load_hydro.assert_called_once()
 
@@ -214,22 +223,19 @@ def test_get_available_river_miles_dir_not_found():
         )
 
 
-def test_get_available_river_miles_invalid_format(caplog):
+def test_get_available_river_miles_invalid_format(tmp_path, caplog):
     """Test get_available_river_miles with invalid river mile file formats."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Valid file
-        (temp_path / "RM_54.0.xlsx").touch()
-        # Invalid value for float conversion
-        (temp_path / "RM_invalid.xlsx").touch()
-        # Edge case: empty string after RM_
-        (temp_path / "RM_.xlsx").touch()
-
-        result = DataLoader.get_available_river_miles(temp_path)
-
-        # Only the valid file should be parsed
-        assert result == [54.0]
-        # Check that warnings were logged
-        assert "Skipping invalid river mile file: RM_invalid.xlsx" in caplog.text
-        assert "Skipping invalid river mile file: RM_.xlsx" in caplog.text
+    # Valid file
+    (tmp_path / "RM_54.0.xlsx").touch()
+    # Invalid value for float conversion
+    (tmp_path / "RM_invalid.xlsx").touch()
+    # Edge case: empty string after RM_
+    (tmp_path / "RM_.xlsx").touch()
+
+    result = DataLoader.get_available_river_miles(tmp_path)
+
+    # Only the valid file should be parsed
+    assert result == [54.0]
+    # Check that warnings were logged
+    assert "Skipping invalid river mile file: RM_invalid.xlsx" in caplog.text
+    assert "Skipping invalid river mile file: RM_.xlsx" in caplog.text
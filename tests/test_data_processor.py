@@ -1,9 +1,11 @@
 """Tests for the data processor module."""
 
+import logging
 import tempfile
 from pathlib import Path
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -28,6 +30,20 @@ def test_processing_metrics():
     assert metrics.valid_rows == 70
 
 
+def test_processing_metrics_log_metrics(caplog):
+    """Test that log_metrics reports every counter."""
+    metrics = ProcessingMetrics(
+        original_rows=100, invalid_rows=10, zero_values=5, null_values=15, valid_rows=70
+    )
+
+    with caplog.at_level(logging.INFO):
+        metrics.log_metrics()
+
+    assert "Original rows: 100" in caplog.text
+    assert "Null values: 15" in caplog.text
+    assert "Valid rows: 70" in caplog.text
+
+
 def test_river_mile_data_initialization():
     """Test RiverMileData initialization."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -94,8 +110,10 @@ def test_convert_to_navd88():
     assert "Time (Minutes)" in processed.columns
     assert processed["Time (Minutes)"].tolist() == [0.0, 1.0, 2.0]
 
-    # Check sensor values were transformed
+    # Check sensor values were transformed, leaving the input untouched
     assert processed["Sensor_1"].tolist() != test_data["Sensor_1"].tolist()
+    assert test_data["Sensor_1"].tolist() == [5.0, 6.0, 7.0]
+    assert "Time (Minutes)" not in test_data.columns
 
     # Ensure Y offset was applied
     constants = config.navd88_constants
@@ -169,3 +187,101 @@ def test_process_data_internal_error():
     ):
         with pytest.raises(RuntimeError, match="Dataframe processing failed"):
             processor.process_data(54.0, 2023, "Sensor_1")
+
+
+def test_compute_validity_masks_integer_hydrograph():
+    """Test that integer hydrograph columns are masked without a float upcast."""
+    config = Config()
+    summary_data = pd.DataFrame(
+        {"River_Mile": [54.0], "Y_Offset": [10.5], "Num_Sensors": [2]}
+    )
+    processor = SeatekDataProcessor(
+        data_dir=config.processed_dir, summary_data=summary_data, config=config
+    )
+
+    processed = pd.DataFrame(
+        {
+            "Sensor_1": [1.0, 0.0, float("nan"), 2.0],
+            "Hydrograph (Lagged)": [0, 150, 130, 0],
+        }
+    )
+
+    sensor_mask, hydro_mask, null_values, zero_values = (
+        processor._compute_validity_masks(processed, "Sensor_1")
+    )
+
+    assert sensor_mask.tolist() == [True, False, False, True]
+    assert hydro_mask is not None
+    assert hydro_mask.tolist() == [False, True, True, False]
+    assert null_values == 1
+    assert zero_values == 1
+
+
+@pytest.mark.parametrize("max_workers", [1, 2], ids=["serial", "process_pool"])
+def test_load_data_skips_bad_files(tmp_path, max_workers, caplog):
+    """Test load_data loads valid river mile files in order and logs bad ones."""
+    sheet = pd.DataFrame(
+        {"Time (Seconds)": [0, 60], "Year": [1, 2], "Sensor_1": [1.0, 2.0]}
+    )
+    sheet.to_excel(tmp_path / "RM_54.0.xlsx", index=False)
+    sheet.to_excel(tmp_path / "RM_53.0.xlsx", index=False)
+    sheet.drop(columns="Sensor_1").to_excel(tmp_path / "RM_52.0.xlsx", index=False)
+
+    summary_data = pd.DataFrame({"River_Mile": [53.0, 54.0], "Y_Offset": [0.0, 0.0]})
+    config = Config(base_dir=tmp_path, max_workers=max_workers)
+    processor = SeatekDataProcessor(
+        data_dir=tmp_path, summary_data=summary_data, config=config
+    )
+
+    processor.load_data()
+
+    assert list(processor.river_mile_data) == [53.0, 54.0]
+    assert processor.river_mile_data[54.0].sensors == ["Sensor_1"]
+    assert sorted(processor.river_mile_data[54.0].year_data_cache) == [1, 2]
+    assert "Error loading RM_52.0.xlsx" in caplog.text
+
+
+def test_load_data_is_serial_by_default(tmp_path):
+    """Test load_data parses in the calling process unless workers are enabled."""
+    pd.DataFrame({"Time (Seconds)": [0], "Year": [1], "Sensor_1": [1.0]}).to_excel(
+        tmp_path / "RM_54.0.xlsx", index=False
+    )
+    processor = SeatekDataProcessor(
+        data_dir=tmp_path,
+        summary_data=pd.DataFrame({"River_Mile": [54.0], "Y_Offset": [0.0]}),
+        config=Config(base_dir=tmp_path),
+    )
+
+    with mock.patch(
+        "src.hydrograph_seatek_analysis.data.processor.ProcessPoolExecutor"
+    ) as mock_pool:
+        processor.load_data()
+
+    mock_pool.assert_not_called()
+    assert list(processor.river_mile_data) == [54.0]
+
+
+def test_river_mile_data_sorts_year_blocks(tmp_path):
+    """Test that load_data caches each year block in time order."""
+    pd.DataFrame(
+        {
+            "Time (Seconds)": [120, 0, 60, 30],
+            "Year": [1, 1, 1, 2],
+            "Sensor_1": [3.0, 1.0, 2.0, 4.0],
+        }
+    ).to_excel(tmp_path / "RM_54.0.xlsx", index=False)
+
+    river_mile_data = RiverMileData(tmp_path / "RM_54.0.xlsx")
+    river_mile_data.load_data()
+
+    year_1 = river_mile_data.year_data_cache[1]
+    assert "Year" not in year_1.columns
+    assert year_1["Time (Seconds)"].tolist() == [0, 60, 120]
+    assert year_1["Sensor_1"].tolist() == [1.0, 2.0, 3.0]
+    assert river_mile_data.year_data_cache[2]["Time (Seconds)"].tolist() == [30]
+    # Readings are stored as float32, time keeps full precision
+    assert river_mile_data.data["Sensor_1"].dtype == np.float32
+    assert river_mile_data.data["Time (Minutes)"].dtype == np.float64
+    # Year keys are stored as int16; the cache keys stay plain ints
+    assert river_mile_data.data["Year"].dtype == np.int16
+    assert all(type(year) is int for year in river_mile_data.year_data_cache)
@@ -0,0 +1,24 @@
+"""Tests for Excel reader selection."""
+
+import importlib
+from unittest import mock
+
+from src.hydrograph_seatek_analysis.utils import excel
+
+
+def test_excel_engine_prefers_calamine_when_installed():
+    """Test that python-calamine is used whenever it is importable."""
+    try:
+        with mock.patch("importlib.util.find_spec", return_value=object()):
+            assert importlib.reload(excel).EXCEL_ENGINE == "calamine"
+    finally:
+        importlib.reload(excel)
+
+
+def test_excel_engine_falls_back_to_openpyxl():
+    """Test that openpyxl is used when python-calamine is not installed."""
+    try:
+        with mock.patch("importlib.util.find_spec", return_value=None):
+            assert importlib.reload(excel).EXCEL_ENGINE == "openpyxl"
+    finally:
+        importlib.reload(excel)
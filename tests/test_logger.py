@@ -53,3 +53,17 @@ def test_configure_root_logger():
 
         # Check for handlers (one for console, one for file)
         assert len(root_logger.handlers) > 0
+
+
+def test_setup_logger_file_format(tmp_path):
+    """Test that file records use the shared "{"-style layout."""
+    log_file = tmp_path / "format.log"
+    logger = setup_logger(
+        "test_format_logger", console=False, file_config=FileLogConfig(path=log_file)
+    )
+
+    logger.info("Loaded %s river miles", 3)
+    logger.handlers[0].close()
+
+    line = log_file.read_text().strip()
+    assert line.endswith(" - test_format_logger - INFO - Loaded 3 river miles")
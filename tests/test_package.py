@@ -0,0 +1,34 @@
+"""Tests for the package entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.hydrograph_seatek_analysis as package
+from src.hydrograph_seatek_analysis.core.config import Config
+
+
+def test_lazy_attribute_resolves_to_submodule_class():
+    """Test that public classes are importable from the package root."""
+    assert package.Config is Config
+    assert "Config" in dir(package)
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown names still raise AttributeError."""
+    with pytest.raises(AttributeError, match="NotAClass"):
+        package.NotAClass
+
+
+def test_version_import_does_not_load_matplotlib():
+    """Test that importing the package for its version stays lightweight."""
+    code = (
+        "import sys\n"
+        "from src.hydrograph_seatek_analysis import __version__\n"
+        "assert 'matplotlib' not in sys.modules\n"
+        "assert 'pandas' not in sys.modules\n"
+    )
+    repo_root = Path(__file__).resolve().parents[1]
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
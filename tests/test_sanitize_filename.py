@@ -44,3 +44,9 @@ def test_sanitize_filename_limits_length():
     sanitized = sanitize_filename(long_input)
     assert len(sanitized) == 200
     assert sanitized == "A" * 200
+
+
+def test_sanitize_filename_empty_result_falls_back():
+    """Test that input sanitized down to nothing yields a placeholder name."""
+    assert sanitize_filename(" . ") == "unknown"
+    assert sanitize_filename("") == "unknown"
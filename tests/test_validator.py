@@ -4,132 +4,89 @@ from pathlib import Path
 from unittest import mock
 
 import pandas as pd
+import pytest
 
 from src.hydrograph_seatek_analysis.core.config import Config
 from src.hydrograph_seatek_analysis.data.validator import DataValidator
 
 
-def test_validator_initialization():
+@pytest.fixture(scope="module")
+def config(tmp_path_factory):
+    """Share one Config across the module; no test mutates it.
+
+    Files are validated serially so the mocked paths never cross a process boundary.
+    """
+    return Config(base_dir=tmp_path_factory.mktemp("validator"), max_workers=1)
+
+
+def test_validator_initialization(config):
     """Test DataValidator initialization."""
-    config = Config()
     validator = DataValidator(config)
     assert validator.config == config
 
 
-@mock.patch.object(Path, "is_symlink", return_value=False)
-@mock.patch("pandas.read_excel")
-def test_validate_summary_file(mock_read_excel, mock_is_symlink):
+@pytest.mark.usefixtures("mock_file_checks")
+@pytest.mark.parametrize(
+    "summary_df, expected",
+    [
+        (
+            pd.DataFrame(
+                {
+                    "River_Mile": [54.0, 53.0],
+                    "Y_Offset": [10.5, 11.2],
+                    "Num_Sensors": [2, 2],
+                }
+            ),
+            {
+                "rows": 2,
+                "required_columns_present": True,
+                "river_miles": [54.0, 53.0],
+            },
+        ),
+        # Missing Y_Offset and Num_Sensors: the validator returns None
+        (pd.DataFrame({"River_Mile": [54.0, 53.0]}), None),
+    ],
+    ids=["valid", "missing_columns"],
+)
+def test_validate_summary_file(workbook, config, summary_df, expected):
     """Test validate_summary_file with mocked Excel file."""
-    mock_df = pd.DataFrame(
-        {"River_Mile": [54.0, 53.0], "Y_Offset": [10.5, 11.2], "Num_Sensors": [2, 2]}
-    )
-
-    def mock_read_excel_func(*args, **kwargs):
-        usecols = kwargs.get("usecols")
-        if callable(usecols):
-            for col in mock_df.columns:
-                usecols(col)
-        return mock_df
+    workbook.sheets[None] = summary_df
 
-    mock_read_excel.side_effect = mock_read_excel_func
+    result = DataValidator(config).validate_summary_file()
 
-    config = Config()
-    validator = DataValidator(config)
-
-    # Mock exists check to avoid file not found error
-    with (
-        mock.patch.object(Path, "is_file", return_value=True),
-        mock.patch.object(Path, "stat", return_value=mock.Mock(st_size=1000)),
-    ):
-        result = validator.validate_summary_file()
+    if expected is None:
+        assert result is None
+        return
 
     assert result is not None
     assert result["file"] == config.summary_file.name
-    assert result["rows"] == 2
     assert "River_Mile" in result["columns"]
-    assert result["required_columns_present"] is True
-    assert result["river_miles"] == [54.0, 53.0]
+    assert {key: result[key] for key in expected} == expected
 
 
-@mock.patch.object(Path, "is_symlink", return_value=False)
-@mock.patch("pandas.read_excel")
-def test_validate_summary_file_missing_columns(mock_read_excel, mock_is_symlink):
-    """Test validate_summary_file with missing columns."""
-    mock_df = pd.DataFrame(
-        {
-            "River_Mile": [54.0, 53.0],
-            # Missing Y_Offset and Num_Sensors
-        }
-    )
-
-    def mock_read_excel_func(*args, **kwargs):
-        usecols = kwargs.get("usecols")
-        if callable(usecols):
-            for col in mock_df.columns:
-                usecols(col)
-        return mock_df
-
-    mock_read_excel.side_effect = mock_read_excel_func
-
-    config = Config()
-    validator = DataValidator(config)
-
-    # For missing columns, the validator returns None
-    # Mock exists check to avoid file not found error
-    with (
-        mock.patch.object(Path, "is_file", return_value=True),
-        mock.patch.object(Path, "stat", return_value=mock.Mock(st_size=1000)),
-    ):
-        result = validator.validate_summary_file()
-
-    assert result is None
-
-
-@mock.patch("pandas.ExcelFile")
-@mock.patch.object(Path, "is_symlink", return_value=False)
-@mock.patch("pandas.read_excel")
-def test_validate_hydro_file(mock_read_excel, mock_is_symlink, mock_excel_file_cls):
+@pytest.mark.usefixtures("mock_file_checks")
+def test_validate_hydro_file(workbook, config):
     """Test validate_hydro_file with mocked Excel file."""
-    # Create mock ExcelFile instance
-    mock_excel_file = mock.MagicMock()
-    mock_excel_file.sheet_names = ["RM_54.0", "RM_53.0", "OtherSheet"]
-    mock_excel_file_cls.return_value.__enter__.return_value = mock_excel_file
-
-    # Mock read_excel return values
-    df_54 = pd.DataFrame({"Time (Seconds)": [0, 60, 120], "Year": [1, 1, 1]})
-    df_53 = pd.DataFrame({"Time (Seconds)": [0, 60, 120], "Year": [1, 1, 1]})
-
-    # Configure mock to return different values based on sheet name
-    def mock_read_excel_hydro(*args, **kwargs):
-        sheet = kwargs.get("sheet_name")
-        df = (
-            df_54
-            if sheet == "RM_54.0"
-            else df_53 if sheet == "RM_53.0" else pd.DataFrame()
-        )
-        usecols = kwargs.get("usecols")
-        if callable(usecols):
-            for col in df.columns:
-                usecols(col)
-        return df
-
-    mock_read_excel.side_effect = mock_read_excel_hydro
-
-    config = Config()
-    validator = DataValidator(config)
+    workbook.excel_file.sheet_names = ["RM_54.0", "RM_53.0", "OtherSheet"]
+    workbook.sheets["RM_54.0"] = pd.DataFrame(
+        {"Time (Seconds)": [0, 60, 120], "Year": [1, 1, 1]}
+    )
+    workbook.sheets["RM_53.0"] = pd.DataFrame(
+        {"Time (Seconds)": [0, 60, 120], "Year": [1, 1, 1]}
+    )
 
-    # Mock exists check to avoid file not found error
-    with (
-        mock.patch.object(Path, "is_file", return_value=True),
-        mock.patch.object(Path, "stat", return_value=mock.Mock(st_size=1000)),
-    ):
-        result = validator.validate_hydro_file()
+    result = DataValidator(config).validate_hydro_file()
 
     assert result is not None
     assert result["file"] == config.hydro_file.name
     assert len(result["sheets"]) == 2  # Only RM_ sheets are processed
     assert result["river_mile_sheets"] == ["RM_54.0", "RM_53.0"]
 
+    # Every sheet is read through the shared workbook handle, not the file path
+    assert workbook.read_excel.call_count == 2
+    for call in workbook.read_excel.call_args_list:
+        assert call.args[0] is workbook.excel_file
+
     # Check sheet details
     sheet1 = next(s for s in result["sheets"] if s["name"] == "RM_54.0")
     assert sheet1["rows"] == 3
@@ -138,45 +95,20 @@ def test_validate_hydro_file(mock_read_excel, mock_is_symlink, mock_excel_file_c
     assert sheet1["time_range"] == [0, 120]
 
 
-@mock.patch("pandas.ExcelFile")
-@mock.patch.object(Path, "is_symlink", return_value=False)
-@mock.patch("pandas.read_excel")
-def test_validate_hydro_file_missing_columns(
-    mock_read_excel, mock_is_symlink, mock_excel_file_cls
-):
+@pytest.mark.usefixtures("mock_file_checks")
+def test_validate_hydro_file_missing_columns(workbook, config):
     """Test validate_hydro_file behavior when required columns are absent."""
-    mock_excel_file = mock.MagicMock()
-    mock_excel_file.sheet_names = ["RM_54.0"]
-    mock_excel_file_cls.return_value.__enter__.return_value = mock_excel_file
-
+    workbook.excel_file.sheet_names = ["RM_54.0"]
     # Missing 'Time (Seconds)' and 'Year'
-    df_missing = pd.DataFrame(
+    workbook.sheets["RM_54.0"] = pd.DataFrame(
         {"SomeOtherCol": [0, 60, 120], "YetAnotherCol": [1, 1, 1]}
     )
 
-    def mock_read_excel_hydro(*args, **kwargs):
-        usecols = kwargs.get("usecols")
-        if callable(usecols):
-            # Our stateful filter logic expects columns to be passed iteratively
-            for col in df_missing.columns:
-                usecols(col)
-        # Because we load at least the first column, we mock the dataframe subset
-        return df_missing[["SomeOtherCol"]]
-
-    mock_read_excel.side_effect = mock_read_excel_hydro
-
-    config = Config()
-    validator = DataValidator(config)
-
-    with (
-        mock.patch.object(Path, "is_file", return_value=True),
-        mock.patch.object(Path, "stat", return_value=mock.Mock(st_size=1000)),
-    ):
-        result = validator.validate_hydro_file()
+    result = DataValidator(config).validate_hydro_file()
 
     assert result is not None
     sheet1 = result["sheets"][0]
-    # Rows should match the length of the loaded first column (3 rows)
+    # Only the anchor first column is loaded, so rows still match (3 rows)
     assert sheet1["rows"] == 3
     # Required columns were absent
     assert sheet1["required_columns_present"] is False
@@ -184,22 +116,13 @@ def test_validate_hydro_file_missing_columns(
     assert sheet1["time_range"] is None
 
 
-@mock.patch.object(Path, "is_symlink", return_value=False)
-@mock.patch("pandas.read_excel")
-def test_validate_processed_files_missing_columns(mock_read_excel, mock_is_symlink):
+@pytest.mark.usefixtures("mock_file_checks")
+def test_validate_processed_files_missing_columns(workbook, config):
     """Test validate_processed_files behavior when required and sensor columns are absent."""
-    df_missing = pd.DataFrame({"RandomData": [1.0, 2.0], "MoreRandomData": [3.0, 4.0]})
-
-    def mock_read_excel_proc(*args, **kwargs):
-        usecols = kwargs.get("usecols")
-        if callable(usecols):
-            for col in df_missing.columns:
-                usecols(col)
-        return df_missing[["RandomData"]]
-
-    mock_read_excel.side_effect = mock_read_excel_proc
+    workbook.sheets[None] = pd.DataFrame(
+        {"RandomData": [1.0, 2.0], "MoreRandomData": [3.0, 4.0]}
+    )
 
-    config = Config()
     validator = DataValidator(config)
 
     # Create a mock path object that matches glob "RM_*.xlsx"
@@ -210,11 +133,7 @@ def test_validate_processed_files_missing_columns(mock_read_excel, mock_is_symli
     mock_file.exists.return_value = True
     mock_file.is_symlink.return_value = False
 
-    with (
-        mock.patch.object(Path, "is_file", return_value=True),
-        mock.patch.object(Path, "glob", return_value=[mock_file]),
-    ):
-
+    with mock.patch.object(Path, "glob", return_value=[mock_file]):
         results = validator.validate_processed_files()
 
     assert len(results) == 1
@@ -227,16 +146,112 @@ def test_validate_processed_files_missing_columns(mock_read_excel, mock_is_symli
     assert res["time_range"] is None
 
 
+@pytest.mark.usefixtures("mock_file_checks")
+def test_validate_processed_files_lists_sensors_without_loading_them(workbook, config):
+    """Test sensor columns are listed from the headers but not parsed."""
+    workbook.sheets[None] = pd.DataFrame(
+        {
+            "Time (Seconds)": [0.0, 60.0],
+            "Sensor_1": [1.0, 2.0],
+            "Year": [1, 2],
+            "Sensor_2": [3.0, 4.0],
+        }
+    )
+    mock_file = mock.MagicMock()
+    mock_file.name = "RM_54.0.xlsx"
+    mock_file.stem = "RM_54.0"
+    mock_file.stat.return_value.st_size = 1000
+    mock_file.is_symlink.return_value = False
+
+    with (
+        mock.patch.object(Path, "exists", return_value=True),
+        mock.patch.object(Path, "glob", return_value=[mock_file]),
+    ):
+        (result,) = DataValidator(config).validate_processed_files()
+
+    assert result["sensor_columns"] == ["Sensor_1", "Sensor_2"]
+    assert result["year_range"] == [1, 2]
+    assert result["time_range"] == [0.0, 60.0]
+    usecols = workbook.read_excel.call_args.kwargs["usecols"]
+    assert not usecols("Sensor_1")
+    assert usecols("Year")
+
+
+@pytest.mark.usefixtures("mock_file_checks")
+def test_iter_processed_files_reads_files_lazily(workbook, config):
+    """Test iter_processed_files reads each file only when its result is requested."""
+    workbook.sheets[None] = pd.DataFrame(
+        {"Time (Seconds)": [0.0, 60.0], "Year": [1, 1], "Sensor_1": [1.0, 2.0]}
+    )
+    files = []
+    for name in ("RM_54.0.xlsx", "RM_53.0.xlsx"):
+        mock_file = mock.MagicMock()
+        mock_file.name = name
+        mock_file.stem = name.removesuffix(".xlsx")
+        mock_file.stat.return_value.st_size = 1000
+        mock_file.is_symlink.return_value = False
+        files.append(mock_file)
+
+    with (
+        mock.patch.object(Path, "exists", return_value=True),
+        mock.patch.object(Path, "glob", return_value=iter(files)),
+    ):
+        results = DataValidator(config).iter_processed_files()
+        assert workbook.read_excel.call_count == 0
+
+        assert next(results)["river_mile"] == 54.0
+        assert workbook.read_excel.call_count == 1
+        assert [r["river_mile"] for r in results] == [53.0]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2], ids=["serial", "process_pool"])
+def test_validate_processed_files_in_file_order(tmp_path, max_workers):
+    """Test processed files are validated in file order, serially or in parallel."""
+    config = Config(base_dir=tmp_path, max_workers=max_workers)
+    config.processed_dir.mkdir(parents=True)
+    sheet = pd.DataFrame(
+        {"Time (Seconds)": [0.0, 60.0], "Year": [1, 2], "Sensor_1": [1.0, 2.0]}
+    )
+    sheet.to_excel(config.processed_dir / "RM_54.0.xlsx", index=False)
+    sheet.to_excel(config.processed_dir / "RM_53.0.xlsx", index=False)
+    (config.processed_dir / "RM_52.0.xlsx").write_bytes(b"not a workbook")
+
+    results = DataValidator(config).validate_processed_files()
+
+    file_order = [path.name for path in config.processed_dir.glob("RM_*.xlsx")]
+    assert [r["file"] for r in results] == file_order
+    by_name = {r["file"]: r for r in results}
+    assert "error" in by_name["RM_52.0.xlsx"]
+    assert by_name["RM_54.0.xlsx"]["sensor_columns"] == ["Sensor_1"]
+    assert by_name["RM_54.0.xlsx"]["year_range"] == [1, 2]
+
+
+def test_validate_processed_files_is_serial_by_default(tmp_path):
+    """Test processed files are validated in-process unless workers are enabled."""
+    config = Config(base_dir=tmp_path)
+    config.processed_dir.mkdir(parents=True)
+    pd.DataFrame({"Time (Seconds)": [0.0], "Year": [1], "Sensor_1": [1.0]}).to_excel(
+        config.processed_dir / "RM_54.0.xlsx", index=False
+    )
+
+    with mock.patch(
+        "src.hydrograph_seatek_analysis.data.validator.ProcessPoolExecutor"
+    ) as mock_pool:
+        results = DataValidator(config).validate_processed_files()
+
+    mock_pool.assert_not_called()
+    assert [r["file"] for r in results] == ["RM_54.0.xlsx"]
+
+
 @mock.patch.object(DataValidator, "validate_summary_file")
 @mock.patch.object(DataValidator, "validate_hydro_file")
 @mock.patch.object(DataValidator, "validate_processed_files")
-def test_run_validation_success(mock_processed, mock_hydro, mock_summary):
+def test_run_validation_success(mock_processed, mock_hydro, mock_summary, config):
     """Test run_validation when all files are valid and consistent."""
     mock_summary.return_value = {"river_miles": [54.0, 53.0]}
     mock_hydro.return_value = {"mock_key": "mock_value"}
     mock_processed.return_value = [{"river_mile": 54.0}, {"river_mile": 53.0}]
 
-    config = Config()
     validator = DataValidator(config)
 
     result = validator.run_validation()
@@ -254,13 +269,12 @@ def test_run_validation_success(mock_processed, mock_hydro, mock_summary):
 @mock.patch.object(DataValidator, "validate_summary_file")
 @mock.patch.object(DataValidator, "validate_hydro_file")
 @mock.patch.object(DataValidator, "validate_processed_files")
-def test_run_validation_inconsistent(mock_processed, mock_hydro, mock_summary):
+def test_run_validation_inconsistent(mock_processed, mock_hydro, mock_summary, config):
     """Test run_validation when files are valid but river miles are inconsistent."""
     mock_summary.return_value = {"river_miles": [54.0, 53.0]}
     mock_hydro.return_value = {"mock_key": "mock_value"}
     mock_processed.return_value = [{"river_mile": 54.0}, {"river_mile": 55.0}]
 
-    config = Config()
     validator = DataValidator(config)
 
     result = validator.run_validation()
@@ -274,13 +288,12 @@ def test_run_validation_inconsistent(mock_processed, mock_hydro, mock_summary):
 @mock.patch.object(DataValidator, "validate_summary_file")
 @mock.patch.object(DataValidator, "validate_hydro_file")
 @mock.patch.object(DataValidator, "validate_processed_files")
-def test_run_validation_failure(mock_processed, mock_hydro, mock_summary):
+def test_run_validation_failure(mock_processed, mock_hydro, mock_summary, config):
     """Test run_validation when files are invalid."""
     mock_summary.return_value = None
     mock_hydro.return_value = None
     mock_processed.return_value = []
 
-    config = Config()
     validator = DataValidator(config)
 
     result = validator.run_validation()
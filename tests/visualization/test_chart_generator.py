@@ -1,60 +1,87 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import pytest
 from matplotlib.figure import Figure
+from matplotlib.image import imread
+from matplotlib.layout_engine import ConstrainedLayoutEngine
 
-from src.hydrograph_seatek_analysis.core.config import Config
+from src.hydrograph_seatek_analysis.core.config import ChartSettings, Config
+from src.hydrograph_seatek_analysis.visualization import (
+    chart_generator as chart_generator_module,
+)
 from src.hydrograph_seatek_analysis.visualization.chart_generator import (
     ChartGenerator,
     ChartMetrics,
+    _downsample_extremes,
+    sensor_number,
 )
 
 
-@pytest.fixture
-def chart_generator():
-    return ChartGenerator()
+@pytest.fixture(autouse=True)
+def close_figures():
+    yield
+    plt.close("all")
 
 
-@pytest.fixture
-def sample_data():
-    return pd.DataFrame(
-        {
-            "Time (Minutes)": [1.0, 2.0, 3.0, 4.0],
-            "Sensor_1": [10.5, 11.2, 10.8, 12.1],
-            "Hydrograph (Lagged)": [100.0, 150.0, 130.0, 160.0],
-        }
-    )
+@pytest.fixture(scope="module")
+def chart_generator():
+    # One generator per module so style setup and matplotlib warm-up run once
+    return ChartGenerator()
 
 
-def test_chart_generator_init():
-    config = Config()
+def test_chart_generator_init(tmp_path):
+    config = Config(base_dir=tmp_path)
     config.chart_settings.figure_size = (12, 8)
     config.chart_settings.dpi = 150
     cg = ChartGenerator(config)
     assert cg.config is not None
     assert cg.chart_settings.figure_size == (12, 8)
     assert cg.chart_settings.dpi == 150
+    # Figures are built at screen resolution and saved at the configured one
+    assert mpl.rcParams["figure.dpi"] == 100
+    assert mpl.rcParams["savefig.dpi"] == 150
+    assert mpl.rcParams["path.simplify_threshold"] == 1.0
+    assert mpl.rcParams["agg.path.chunksize"] == 10000
 
 
-def test_create_chart_success(chart_generator, sample_data):
-    fig, metrics = chart_generator.create_chart(
-        data=sample_data, river_mile=10.5, year=2023, sensor="Sensor_1"
-    )
-
-    assert isinstance(fig, Figure)
-    assert metrics.sensor_count == 4
-    assert metrics.hydro_count == 4
-    assert metrics.time_range_min == 1.0
-    assert metrics.time_range_max == 4.0
-    assert metrics.sensor_min == 10.5
-    assert metrics.sensor_max == 12.1
-    assert metrics.hydro_min == 100.0
-    assert metrics.hydro_max == 160.0
-    assert len(fig.axes) == 2
+@pytest.mark.parametrize(
+    "sensor, expected",
+    [("Sensor_1", "1"), ("Sensor_12_b", "12"), ("Probe", "Probe")],
+)
+def test_sensor_number(sensor, expected):
+    assert sensor_number(sensor) == expected
 
 
 @pytest.mark.parametrize(
     "scenario",
     [
+        {
+            "data": pd.DataFrame(
+                {
+                    "Time (Minutes)": [1.0, 2.0, 3.0, 4.0],
+                    "Sensor_1": [10.5, 11.2, 10.8, 12.1],
+                    "Hydrograph (Lagged)": [100.0, 150.0, 130.0, 160.0],
+                }
+            ),
+            "sensor": "Sensor_1",
+            "metrics": ChartMetrics(
+                sensor_count=4,
+                hydro_count=4,
+                time_range_min=1.0,
+                time_range_max=4.0,
+                sensor_min=10.5,
+                sensor_max=12.1,
+                hydro_min=100.0,
+                hydro_max=160.0,
+            ),
+            "axes": 2,
+        },
         {
             "data": pd.DataFrame(
                 {"Time (Minutes)": [1.0, 2.0], "Sensor_2": [5.0, 6.0]}
@@ -81,20 +108,29 @@ def test_create_chart_success(chart_generator, sample_data):
             "axes": 1,
         },
     ],
+    ids=["sensor_and_hydrograph", "sensor_only", "empty", "no_sensor_column"],
 )
-def test_create_chart_edge_cases(chart_generator, scenario):
+def test_create_chart(chart_generator, scenario):
     fig, metrics = chart_generator.create_chart(
         data=scenario["data"], river_mile=12.0, year=2024, sensor=scenario["sensor"]
     )
 
     assert isinstance(fig, Figure)
-    assert metrics.sensor_count == scenario["sensor_count"]
-    assert metrics.hydro_count == scenario["hydro_count"]
+    if "metrics" in scenario:
+        assert metrics == scenario["metrics"]
+    else:
+        assert metrics.sensor_count == scenario["sensor_count"]
+        assert metrics.hydro_count == scenario["hydro_count"]
     assert len(fig.axes) == scenario["axes"]
 
 
-def test_create_chart_exception_handling(chart_generator, mocker):
-    mocker.patch("matplotlib.pyplot.subplots", side_effect=Exception("Test Error"))
+def test_create_chart_exception_handling(mocker):
+    # Fresh generator: the shared one may already hold its reusable figure
+    chart_generator = ChartGenerator()
+    mocker.patch(
+        "src.hydrograph_seatek_analysis.visualization.chart_generator.FigureCanvasAgg",
+        side_effect=Exception("Test Error"),
+    )
     fig, metrics = chart_generator.create_chart(
         data=pd.DataFrame({"Time (Minutes)": [1.0], "Sensor_1": [1.0]}),
         river_mile=10.0,
@@ -103,3 +139,329 @@ def test_create_chart_exception_handling(chart_generator, mocker):
     )
     assert fig is None
     assert isinstance(metrics, ChartMetrics)
+
+
+def test_save_chart_creates_output_directory_once(chart_generator, tmp_path, mocker):
+    mkdir_spy = mocker.spy(Path, "mkdir")
+    output_dir = tmp_path / "RM_10.5"
+
+    for name in ("Year_2023_Sensor_1.png", "Year_2024_Sensor_1.png"):
+        fig, _ = chart_generator.create_chart(
+            data=pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]}),
+            river_mile=10.5,
+            year=2023,
+            sensor="Sensor_1",
+        )
+        assert chart_generator.save_chart(fig, str(output_dir / name))
+
+    assert (output_dir / "Year_2023_Sensor_1.png").is_file()
+    assert (output_dir / "Year_2024_Sensor_1.png").is_file()
+    assert mkdir_spy.call_count == 1
+
+
+def test_create_chart_rasterizes_markers(chart_generator):
+    data = pd.DataFrame(
+        {
+            "Time (Minutes)": [1.0, 2.0],
+            "Sensor_1": [1.0, 2.0],
+            "Hydrograph (Lagged)": [10.0, 20.0],
+        }
+    )
+    fig, _ = chart_generator.create_chart(
+        data=data, river_mile=10.0, year=2022, sensor="Sensor_1"
+    )
+
+    lines = [line for ax in fig.axes for line in ax.lines]
+    assert len(lines) == 2
+    assert all(line.get_rasterized() for line in lines)
+
+
+@pytest.mark.parametrize(
+    "hydro_values, expected_fmt",
+    [([100.0, None, 160.0], "{x:,.0f}"), ([100.5, None, 160.0], "{x:,.2f}")],
+    ids=["integers", "fractions"],
+)
+def test_hydrograph_plots_non_nan_points(chart_generator, hydro_values, expected_fmt):
+    data = pd.DataFrame(
+        {
+            "Time (Minutes)": [1.0, 2.0, 3.0],
+            "Sensor_1": [1.0, 2.0, 3.0],
+            "Hydrograph (Lagged)": hydro_values,
+        }
+    )
+    fig, _ = chart_generator.create_chart(data, 10.0, 2022, "Sensor_1")
+
+    hydro_axis = fig.axes[1]
+    assert hydro_axis.lines[0].get_xdata().tolist() == [1.0, 3.0]
+    assert hydro_axis.yaxis.get_major_formatter().fmt == expected_fmt
+
+
+def test_create_chart_reuses_figure(chart_generator):
+    with_hydro = pd.DataFrame(
+        {
+            "Time (Minutes)": [1.0, 2.0],
+            "Sensor_1": [1.0, 2.0],
+            "Hydrograph (Lagged)": [10.0, 20.0],
+        }
+    )
+    sensor_only = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_2": [3.0, 4.0]})
+
+    first, _ = chart_generator.create_chart(with_hydro, 10.0, 2022, "Sensor_1")
+    assert len(first.axes) == 2
+    second, _ = chart_generator.create_chart(sensor_only, 10.0, 2023, "Sensor_2")
+
+    # Same figure, with the previous chart's hydrograph axes and artists removed
+    assert second is first
+    assert len(second.axes) == 1
+    assert len(second.axes[0].lines) == 1
+    assert second.axes[0].get_title().startswith("River Mile 10.0 - Year 2023")
+    # Constrained layout fits the chart while drawing, so savefig needs no bbox pass
+    assert isinstance(second.get_layout_engine(), ConstrainedLayoutEngine)
+    assert second.axes[0].get_in_layout()
+
+
+def test_downsample_extremes_keeps_spikes_in_order():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros(1000)
+    y[123] = 50.0
+    y[877] = -50.0
+
+    kept_x, kept_y = _downsample_extremes(x, y, max_points=100)
+
+    assert len(kept_x) <= 100
+    assert np.all(np.diff(kept_x) > 0)
+    assert {123.0, 877.0} <= set(kept_x.tolist())
+    assert kept_y.max() == 50.0 and kept_y.min() == -50.0
+    # Within budget, or with no budget, the series is returned as is
+    assert _downsample_extremes(x, y, None)[0] is x
+    assert _downsample_extremes(x, y, 1000)[0] is x
+
+
+def test_create_chart_limits_markers_per_series(tmp_path):
+    config = Config(base_dir=tmp_path)
+    config.chart_settings.max_points = 50
+    times = np.arange(500, dtype=np.float64)
+    data = pd.DataFrame(
+        {"Time (Minutes)": times, "Sensor_1": times, "Hydrograph (Lagged)": times}
+    )
+
+    fig, metrics = ChartGenerator(config).create_chart(data, 10.0, 2022, "Sensor_1")
+
+    assert metrics.sensor_count == 500
+    assert [len(ax.lines[0].get_xdata()) for ax in fig.axes] == [50, 50]
+
+
+def test_close_releases_reusable_figure():
+    chart_generator = ChartGenerator()
+    data = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]})
+    first, _ = chart_generator.create_chart(data, 10.0, 2022, "Sensor_1")
+
+    chart_generator.close()
+
+    assert first.axes == []
+    second, _ = chart_generator.create_chart(data, 10.0, 2022, "Sensor_1")
+    assert second is not first
+    assert len(second.axes[0].lines) == 1
+
+
+def test_create_chart_grid(chart_generator):
+    sensor_only = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]})
+    with_hydro = sensor_only.assign(**{"Hydrograph (Lagged)": [10.0, 20.0]})
+    entries = [
+        (2022, "Sensor_1", with_hydro),
+        (2023, "Sensor_1", sensor_only),
+        (2024, "Sensor_1", sensor_only),
+    ]
+
+    fig = chart_generator.create_chart_grid(entries, river_mile=10.0)
+
+    assert isinstance(fig, Figure)
+    # 2x2 grid, the fourth cell hidden, plus one twin axes for the hydrograph
+    assert len(fig.axes) == 5
+    assert [ax.get_visible() for ax in fig.axes[:4]] == [True, True, True, False]
+    assert fig.axes[0].get_title() == "Year 2022 - Sensor 1"
+    assert len(fig.legends) == 1
+    assert [t.get_text() for t in fig.legends[0].get_texts()] == [
+        "Sensor 1 (NAVD88)",
+        "Hydrograph (GPM)",
+    ]
+
+
+def test_chart_grid_saved_within_pixel_budget(tmp_path, monkeypatch):
+    monkeypatch.setattr(chart_generator_module, "GRID_MAX_PIXELS", 1_000_000)
+    config = Config(base_dir=tmp_path)
+    config.chart_settings.dpi = 100
+    generator = ChartGenerator(config)
+    data = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]})
+
+    # One 6x4 in panel at 100 dpi is within the budget: saved as configured
+    small = generator.create_chart_grid([(2022, "Sensor_1", data)], river_mile=10.0)
+    assert generator.save_chart(
+        small, str(tmp_path / "small.png"), dpi=generator.grid_dpi(small)
+    )
+    assert imread(tmp_path / "small.png").shape[:2] == (400, 600)
+
+    # Twelve panels (24x12 in) would be 2400x1200 px: the dpi is lowered instead
+    entries = [(year, "Sensor_1", data) for year in range(2010, 2022)]
+    large = generator.create_chart_grid(entries, river_mile=10.0)
+    assert generator.save_chart(
+        large, str(tmp_path / "large.png"), dpi=generator.grid_dpi(large)
+    )
+    height, width = imread(tmp_path / "large.png").shape[:2]
+    assert width * height <= 1_000_000
+    assert (width, height) == (24 * 58, 12 * 58)
+
+
+def test_figures_are_not_registered_with_pyplot(chart_generator):
+    data = pd.DataFrame({"Time (Minutes)": [1.0], "Sensor_1": [1.0]})
+    plt.close("all")
+
+    chart_generator.create_chart(data, 10.0, 2022, "Sensor_1")
+    chart_generator.create_chart_grid([(2022, "Sensor_1", data)], river_mile=10.0)
+
+    # Nothing for callers to plt.close(): the figures are freed by refcount
+    assert plt.get_fignums() == []
+
+
+def test_save_chart_in_background_matches_serial_save(tmp_path):
+    data = pd.DataFrame(
+        {
+            "Time (Minutes)": [1.0, 2.0],
+            "Sensor_1": [1.0, 2.0],
+            "Hydrograph (Lagged)": [10.0, 20.0],
+        }
+    )
+    config = Config(base_dir=tmp_path)
+    serial = ChartGenerator(config)
+    fig, _ = serial.create_chart(data, 10.0, 2022, "Sensor_1")
+    assert serial.save_chart(fig, str(tmp_path / "serial.png"), dpi=50)
+
+    config.chart_settings.save_workers = 2
+    background = ChartGenerator(config)
+    fig, _ = background.create_chart(data, 10.0, 2022, "Sensor_1")
+    assert background.save_chart(fig, str(tmp_path / "background.png"), dpi=50)
+    # A directory cannot be written as an image: fails in the worker process
+    (tmp_path / "taken.png").mkdir()
+    assert background.save_chart(fig, str(tmp_path / "taken.png"), dpi=50)
+
+    assert background.finish_saves() == 1
+    assert (
+        imread(tmp_path / "serial.png") == imread(tmp_path / "background.png")
+    ).all()
+
+
+def test_background_saves_are_bounded(tmp_path):
+    data = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]})
+    config = Config(base_dir=tmp_path)
+    config.chart_settings.save_workers = 2
+    background = ChartGenerator(config)
+    fig, _ = background.create_chart(data, 10.0, 2022, "Sensor_1")
+    # Fails in the worker, and is waited for before the batch is finished
+    (tmp_path / "taken.png").mkdir()
+    assert background.save_chart(fig, str(tmp_path / "taken.png"), dpi=20)
+
+    for i in range(6):
+        assert background.save_chart(fig, str(tmp_path / f"{i}.png"), dpi=20)
+        assert len(background._pending_saves) <= 4
+
+    assert background.finish_saves() == 1
+    assert len(list(tmp_path.glob("[0-9].png"))) == 6
+
+
+def test_close_drains_background_saves(tmp_path):
+    data = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]})
+    config = Config(base_dir=tmp_path)
+    config.chart_settings.save_workers = 2
+    background = ChartGenerator(config)
+    fig, _ = background.create_chart(data, 10.0, 2022, "Sensor_1")
+    assert background.save_chart(fig, str(tmp_path / "chart.png"), dpi=50)
+
+    # Without finish_saves, e.g. when the batch was interrupted by an error
+    background.close()
+
+    assert background._save_pool is None
+    assert background._pending_saves == []
+    assert (tmp_path / "chart.png").is_file()
+
+
+def test_save_chart_records_digest_for_unchanged_check(chart_generator, tmp_path):
+    data = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]})
+    output_path = tmp_path / "chart.png"
+    digest = chart_generator.chart_digest(data, 10.0, 2022, "Sensor_1")
+    assert not chart_generator.is_chart_current(output_path, digest)
+
+    fig, _ = chart_generator.create_chart(data, 10.0, 2022, "Sensor_1")
+    assert chart_generator.save_chart(fig, str(output_path), digest=digest)
+
+    assert chart_generator.is_chart_current(output_path, digest)
+    # Any change to the plotted values or title fields gives a new digest
+    changed = data.assign(Sensor_1=[1.0, 2.5])
+    for args in [(changed, 10.0, 2022), (data, 10.0, 2023), (data, 11.0, 2022)]:
+        assert chart_generator.chart_digest(*args, "Sensor_1") != digest
+
+
+def test_save_chart_without_digest_clears_stale_digest(chart_generator, tmp_path):
+    data_a = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]})
+    data_b = data_a.assign(Sensor_1=[3.0, 4.0])
+    output_path = tmp_path / "chart.png"
+    digest_a = chart_generator.chart_digest(data_a, 10.0, 2022, "Sensor_1")
+
+    fig, _ = chart_generator.create_chart(data_a, 10.0, 2022, "Sensor_1")
+    assert chart_generator.save_chart(fig, str(output_path), digest=digest_a)
+    fig, _ = chart_generator.create_chart(data_b, 10.0, 2022, "Sensor_1")
+    assert chart_generator.save_chart(fig, str(output_path))
+
+    # The image now shows data B, so it must not be reported as drawn from A
+    assert not chart_generator.is_chart_current(output_path, digest_a)
+
+
+def test_failed_save_clears_stale_digest(chart_generator, tmp_path, mocker):
+    data = pd.DataFrame({"Time (Minutes)": [1.0, 2.0], "Sensor_1": [1.0, 2.0]})
+    output_path = tmp_path / "chart.png"
+    digest = chart_generator.chart_digest(data, 10.0, 2022, "Sensor_1")
+    fig, _ = chart_generator.create_chart(data, 10.0, 2022, "Sensor_1")
+    assert chart_generator.save_chart(fig, str(output_path), digest=digest)
+
+    mocker.patch.object(fig, "savefig", side_effect=OSError("disk full"))
+    assert not chart_generator.save_chart(fig, str(output_path), digest=digest)
+
+    assert not chart_generator.is_chart_current(output_path, digest)
+
+
+def test_create_chart_grid_empty(chart_generator):
+    assert chart_generator.create_chart_grid([], river_mile=10.0) is None
+
+
+def test_base_style_applied_without_seaborn():
+    # A fresh interpreter, so modules imported by other tests cannot leak in
+    code = (
+        "import sys\n"
+        "import matplotlib as mpl\n"
+        "from src.hydrograph_seatek_analysis.visualization.chart_generator import (\n"
+        "    BASE_STYLE,\n"
+        "    ChartGenerator,\n"
+        ")\n"
+        "ChartGenerator()\n"
+        "assert 'seaborn' not in sys.modules\n"
+        "for key, value in BASE_STYLE.items():\n"
+        "    assert mpl.rcParams[key] == mpl.rcParams.validate[key](value), key\n"
+    )
+    repo_root = Path(__file__).resolve().parents[2]
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=repo_root)
+
+
+def test_rc_settings_reapplied_only_when_changed(tmp_path, mocker):
+    ChartGenerator()
+    update = mocker.spy(mpl.rcParams, "update")
+
+    ChartGenerator()
+    update.assert_not_called()
+
+    config = Config(base_dir=tmp_path)
+    config.chart_settings.font_size = 9
+    ChartGenerator(config)
+    update.assert_called_once()
+    assert mpl.rcParams["font.size"] == 9
+
+    ChartGenerator()  # restore the defaults for the other tests
+    assert mpl.rcParams["font.size"] == ChartSettings().font_size
@@ -15,7 +15,7 @@ import json
 import logging
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, List
 
 from src.hydrograph_seatek_analysis.core.config import Config
 from src.hydrograph_seatek_analysis.core.logger import configure_root_logger
@@ -39,115 +39,158 @@ def parse_args() -> argparse.Namespace:
         "--data-dir", type=str, help="Base data directory (overrides default)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes that validate processed files (default: 1, serial; 0 uses one per CPU core)",
+    )
+
     return parser.parse_args()
 
 
-def _print_summary_validation(results: dict, config: Config) -> None:
-    """Print summary file validation results."""
-    print(" 📋 SUMMARY FILE ".center(51, "="))
-    if results["summary"]:
-        print(f"  ✅ File: {results['summary']['file']}")
-        print(f"  📊 Rows: {results['summary']['rows']:,}")
-        print(f"  📑 Columns: {', '.join(results['summary']['columns'])}")
-        req_icon = "✅" if results["summary"]["required_columns_present"] else "❌"
-        print(
-            f"  {req_icon} Required columns present: {results['summary']['required_columns_present']}"
-        )
-        print(
-            f"  🏞️  River miles: {', '.join(str(rm) for rm in results['summary']['river_miles'])}"
-        )
+def _format_summary_validation(results: dict, config: Config) -> List[str]:
+    """Format summary file validation results as report lines."""
+    lines = [" 📋 SUMMARY FILE ".center(51, "=")]
+    summary = results["summary"]
+    if summary:
+        req_present = summary["required_columns_present"]
+        req_icon = "✅" if req_present else "❌"
+        lines += [
+            f"  ✅ File: {summary['file']}",
+            f"  📊 Rows: {summary['rows']:,}",
+            f"  📑 Columns: {', '.join(summary['columns'])}",
+            f"  {req_icon} Required columns present: {req_present}",
+            f"  🏞️  River miles: {', '.join(str(rm) for rm in summary['river_miles'])}",
+        ]
     else:
-        print("  ❌ VALIDATION FAILED: Missing or invalid summary data file")
-        print(
-            f"     💡 Please ensure '{config.summary_file.name}' is in the '{config.summary_file.parent}' directory."
-        )
-
-
-def _print_hydrograph_validation(results: dict, config: Config) -> None:
-    """Print hydrograph file validation results."""
-    print("\n" + " 🌊 HYDROGRAPH FILE ".center(51, "="))
-    if results["hydrograph"]:
-        print(f"  ✅ File: {results['hydrograph']['file']}")
-        print(
-            f"  📑 River mile sheets: {', '.join(results['hydrograph']['river_mile_sheets'])}"
-        )
-
-        for sheet in results["hydrograph"]["sheets"]:
-            print(f"\n  📄 Sheet: {sheet['name']}")
-            print(f"    📊 Rows: {sheet['rows']:,}")
-            req_icon = "✅" if sheet["required_columns_present"] else "❌"
-            print(
-                f"    {req_icon}  Required columns present: {sheet['required_columns_present']}"
-            )
-            if sheet["years"]:
-                print(f"    📅 Years: {', '.join(str(y) for y in sheet['years'])}")
-            if sheet["time_range"]:
-                print(
-                    f"    ⏱️  Time range: {float(sheet['time_range'][0]):,.0f} to {float(sheet['time_range'][1]):,.0f}"
+        lines += [
+            "  ❌ VALIDATION FAILED: Missing or invalid summary data file",
+            f"     💡 Please ensure '{config.summary_file.name}' is in the '{config.summary_file.parent}' directory.",
+        ]
+    return lines
+
+
+def _format_hydrograph_validation(results: dict, config: Config) -> List[str]:
+    """Format hydrograph file validation results as report lines."""
+    lines = ["\n" + " 🌊 HYDROGRAPH FILE ".center(51, "=")]
+    hydrograph = results["hydrograph"]
+    if hydrograph:
+        lines += [
+            f"  ✅ File: {hydrograph['file']}",
+            f"  📑 River mile sheets: {', '.join(hydrograph['river_mile_sheets'])}",
+        ]
+
+        append = lines.append
+        for sheet in hydrograph["sheets"]:
+            req_present = sheet["required_columns_present"]
+            req_icon = "✅" if req_present else "❌"
+            append(f"\n  📄 Sheet: {sheet['name']}")
+            append(f"    📊 Rows: {sheet['rows']:,}")
+            append(f"    {req_icon}  Required columns present: {req_present}")
+            years = sheet["years"]
+            if years:
+                append(f"    📅 Years: {', '.join(str(y) for y in years)}")
+            time_range = sheet["time_range"]
+            if time_range:
+                append(
+                    f"    ⏱️  Time range: {float(time_range[0]):,.0f} to {float(time_range[1]):,.0f}"
                 )
     else:
-        print("  ❌ VALIDATION FAILED: Missing or invalid hydrograph data file")
-        print(
-            f"     💡 Please ensure '{config.hydro_file.name}' is in the '{config.hydro_file.parent}' directory."
-        )
-
-
-def _print_processed_validation(results: dict) -> None:
-    """Print processed files validation results."""
-    print("\n" + " ⚙️  PROCESSED FILES ".center(51, "="))
-    if results["processed"]:
-        for file_result in results["processed"]:
+        lines += [
+            "  ❌ VALIDATION FAILED: Missing or invalid hydrograph data file",
+            f"     💡 Please ensure '{config.hydro_file.name}' is in the '{config.hydro_file.parent}' directory.",
+        ]
+    return lines
+
+
+def _format_processed_validation(results: dict) -> List[str]:
+    """Format processed files validation results as report lines."""
+    lines = ["\n" + " ⚙️  PROCESSED FILES ".center(51, "=")]
+    processed = results["processed"]
+    if processed:
+        append = lines.append
+        for file_result in processed:
             if "error" in file_result:
-                print(
+                append(
                     f"  ❌ File: {file_result['file']} - ERROR: {file_result['error']}"
                 )
                 continue
 
-            print(f"\n  ✅ File: {file_result['file']}")
-            print(f"    🏞️  River mile: {file_result['river_mile']}")
-            print(f"    📊 Rows: {file_result['rows']:,}")
-            req_icon = "✅" if file_result["required_columns_present"] else "❌"
-            print(
-                f"    {req_icon}  Required columns present: {file_result['required_columns_present']}"
-            )
-            print(f"    📡 Sensor columns: {', '.join(file_result['sensor_columns'])}")
-
-            if file_result["year_range"]:
-                print(
-                    f"    📅 Year range: {file_result['year_range'][0]} to {file_result['year_range'][1]}"
-                )
-            if file_result["time_range"]:
-                print(
-                    f"    ⏱️  Time range: {file_result['time_range'][0]:,.0f} to {file_result['time_range'][1]:,.0f}"
+            req_present = file_result["required_columns_present"]
+            req_icon = "✅" if req_present else "❌"
+            append(f"\n  ✅ File: {file_result['file']}")
+            append(f"    🏞️  River mile: {file_result['river_mile']}")
+            append(f"    📊 Rows: {file_result['rows']:,}")
+            append(f"    {req_icon}  Required columns present: {req_present}")
+            append(f"    📡 Sensor columns: {', '.join(file_result['sensor_columns'])}")
+
+            year_range = file_result["year_range"]
+            if year_range:
+                append(f"    📅 Year range: {year_range[0]} to {year_range[1]}")
+            time_range = file_result["time_range"]
+            if time_range:
+                append(
+                    f"    ⏱️  Time range: {time_range[0]:,.0f} to {time_range[1]:,.0f}"
                 )
     else:
-        print("  ⚠️  No processed files found in the output directory.")
-        print("     💡 Please run 'python seatek_processor.py' first to generate them.")
-
-
-def _print_consistency_validation(results: dict) -> None:
-    """Print river mile consistency validation results."""
-    if results["river_mile_consistency"]:
-        print("\n" + " 🔗 RIVER MILE CONSISTENCY ".center(51, "="))
-        all_processed = results["river_mile_consistency"]["all_summary_rms_processed"]
-        status_icon = "✅" if all_processed else "⚠️"
-        print(
-            f"  {status_icon} All summary river miles have processed data: {all_processed}"
-        )
-
-        if results["river_mile_consistency"]["missing_processed_rms"]:
-            missing_rms_str = ", ".join(
-                str(rm)
-                for rm in results["river_mile_consistency"]["missing_processed_rms"]
-            )
-            print(f"  ❌ Missing processed data for river miles: {missing_rms_str}")
-
-        if results["river_mile_consistency"]["extra_processed_rms"]:
-            extra_rms_str = ", ".join(
-                str(rm)
-                for rm in results["river_mile_consistency"]["extra_processed_rms"]
-            )
-            print(f"  ⚠️  Extra processed data for river miles: {extra_rms_str}")  # fmt: skip
+        lines += [
+            "  ⚠️  No processed files found in the output directory.",
+            "     💡 Please run 'python seatek_processor.py' first to generate them.",
+        ]
+    return lines
+
+
+def _format_consistency_validation(results: dict) -> List[str]:
+    """Format river mile consistency validation results as report lines."""
+    consistency = results["river_mile_consistency"]
+    if not consistency:
+        return []
+
+    all_processed = consistency["all_summary_rms_processed"]
+    status_icon = "✅" if all_processed else "⚠️"
+    lines = [
+        "\n" + " 🔗 RIVER MILE CONSISTENCY ".center(51, "="),
+        f"  {status_icon} All summary river miles have processed data: {all_processed}",
+    ]
+
+    missing_rms = consistency["missing_processed_rms"]
+    if missing_rms:
+        missing_rms_str = ", ".join(str(rm) for rm in missing_rms)
+        lines.append(f"  ❌ Missing processed data for river miles: {missing_rms_str}")
+
+    extra_rms = consistency["extra_processed_rms"]
+    if extra_rms:
+        extra_rms_str = ", ".join(str(rm) for rm in extra_rms)
+        lines.append(f"  ⚠️  Extra processed data for river miles: {extra_rms_str}")  # fmt: skip
+    return lines
+
+
+def _format_validation_report(results: dict, config: Config) -> str:
+    """
+    Format validation results as a human-readable report.
+
+    The report is assembled as a list of lines and joined once, so it can be
+    written to stdout with a single call instead of one print per line.
+
+    Args:
+        results: Results from ``DataValidator.run_validation``
+        config: Configuration the validation ran with
+
+    Returns:
+        The report text, ending with a newline
+    """
+    overall_status = "✅ PASSED" if results["overall_valid"] else "❌ FAILED"
+    lines = [
+        "\n" + "=" * 10 + " ✨ DATA VALIDATION RESULTS ✨ " + "=" * 10 + "\n",
+        *_format_summary_validation(results, config),
+        *_format_hydrograph_validation(results, config),
+        *_format_processed_validation(results),
+        *_format_consistency_validation(results),
+        "\n" + " 🏁 OVERALL VALIDATION ".center(51, "="),
+        f"  STATUS: {overall_status}",
+        "=" * 51 + "\n",
+    ]
+    return "\n".join(lines) + "\n"
 
 
 def main() -> int:
@@ -170,6 +213,8 @@ def main() -> int:
         config_kwargs: dict[str, Any] = {}
         if args.data_dir:
             config_kwargs["base_dir"] = Path(args.data_dir)
+        if args.workers is not None:
+            config_kwargs["max_workers"] = args.workers or None
 
         config = Config(**config_kwargs)  # type: ignore[arg-type]
 
@@ -179,45 +224,32 @@ def main() -> int:
 
         # Output results
         if args.json or args.output:
-            # Convert results to JSON
-            json_results = json.dumps(results, indent=2, default=str)
-
             if args.output:
                 # SECURITY: Validate output path to prevent arbitrary file write / path traversal
                 output_path = Path(args.output)
                 if not is_safe_path(Path.cwd(), output_path):
                     logger.error(
-                        f"SECURITY: Attempted path traversal detected. Path outside current directory: {output_path}"
+                        "SECURITY: Attempted path traversal detected. Path outside current directory: %s",
+                        output_path,
                     )
                     return 1
 
-                # Write to file
+                # Stream the JSON to the file rather than building it as one string
                 with open(args.output, "w") as f:
-                    f.write(json_results)
-                logger.info(f"Validation results written to {args.output}")
+                    json.dump(results, f, indent=2, default=str)
+                logger.info("Validation results written to %s", args.output)
             else:
                 # Print to stdout
-                print(json_results)
+                print(json.dumps(results, indent=2, default=str))
         else:
-            # Print human-readable results
-            print("\n" + "=" * 10 + " ✨ DATA VALIDATION RESULTS ✨ " + "=" * 10 + "\n")
-
-            _print_summary_validation(results, config)
-            _print_hydrograph_validation(results, config)
-            _print_processed_validation(results)
-            _print_consistency_validation(results)
-
-            # Overall verdict
-            print("\n" + " 🏁 OVERALL VALIDATION ".center(51, "="))
-            overall_status = "✅ PASSED" if results["overall_valid"] else "❌ FAILED"
-            print(f"  STATUS: {overall_status}")
-            print("=" * 51 + "\n")
+            # Print human-readable results in a single write
+            sys.stdout.write(_format_validation_report(results, config))
 
         # Return appropriate exit code
         return 0 if results["overall_valid"] else 1
 
     except Exception as e:
-        logger.error(f"Validation failed: {str(e)}")
+        logger.error("Validation failed: %s", e)
         return 1
 
 